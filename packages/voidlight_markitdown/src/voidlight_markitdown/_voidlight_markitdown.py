@@ -132,7 +132,8 @@ class VoidLightMarkItDown(LoggingMixin):
         else:
             self._requests_session = requests_session
 
-        self._magika = magika.Magika()
+        # Loaded on first use; building the model dominates construction time
+        self._magika: Optional[magika.Magika] = None
 
         # TODO - remove these (see enable_builtins)
         self._llm_client: Any = None
@@ -385,15 +386,9 @@ class VoidLightMarkItDown(LoggingMixin):
                 base_guess = base_guess.copy_and_update(url=url)
 
         # Check if we have a seekable stream. If not, load the entire stream into memory.
+        # A single read() lets the BytesIO adopt the bytes without copying them again.
         if not stream.seekable():
-            buffer = io.BytesIO()
-            while True:
-                chunk = stream.read(4096)
-                if not chunk:
-                    break
-                buffer.write(chunk)
-            buffer.seek(0)
-            stream = buffer
+            stream = io.BytesIO(stream.read())
 
         # Add guesses based on stream content
         guesses = self._get_stream_info_guesses(
@@ -541,11 +536,9 @@ class VoidLightMarkItDown(LoggingMixin):
             # Deprecated -- use stream_info
             base_guess = base_guess.copy_and_update(url=url)
 
-        # Read into BytesIO
-        buffer = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=512):
-            buffer.write(chunk)
-        buffer.seek(0)
+        # Read into BytesIO. response.content is read once and cached on the
+        # response, so no chunk-by-chunk copying is needed.
+        buffer = io.BytesIO(response.content)
 
         # Convert
         guesses = self._get_stream_info_guesses(
@@ -764,6 +757,8 @@ class VoidLightMarkItDown(LoggingMixin):
 
         # Call magika to guess from the stream
         cur_pos = file_stream.tell()
+        if self._magika is None:
+            self._magika = magika.Magika()
         try:
             result = self._magika.identify_stream(file_stream)
             if result.status == "ok" and result.prediction.output.label != "unknown":
@@ -4,6 +4,7 @@ Manual Wikipedia Testing Script
 Quick testing tool for Wikipedia URLs with detailed output.
 """
 
+import re
 import sys
 import time
 from urllib.request import urlopen, Request
@@ -11,6 +12,12 @@ from urllib.parse import quote
 
 from voidlight_markitdown import VoidLightMarkItDown, StreamInfo
 
+# Script ranges used for language detection in the converted output
+KOREAN_RE = re.compile(r"[\uac00-\ud7af]")
+CHINESE_RE = re.compile(r"[\u4e00-\u9fff]")
+ARABIC_RE = re.compile(r"[\u0600-\u06ff]")
+HEBREW_RE = re.compile(r"[\u0590-\u05ff]")
+
 
 def test_wikipedia_url(url: str, save_output: bool = False):
     """Test a single Wikipedia URL with detailed output"""
@@ -77,10 +84,10 @@ def test_wikipedia_url(url: str, save_output: bool = False):
         print(f"   - Lists: {'Yes' if any(line.strip().startswith(('- ', '* ', '1.')) for line in lines) else 'No'}")
         
         # Language detection
-        has_korean = any('\uac00' <= char <= '\ud7af' for char in result.markdown)
-        has_chinese = any('\u4e00' <= char <= '\u9fff' for char in result.markdown)
-        has_arabic = any('\u0600' <= char <= '\u06ff' for char in result.markdown)
-        has_hebrew = any('\u0590' <= char <= '\u05ff' for char in result.markdown)
+        has_korean = bool(KOREAN_RE.search(result.markdown))
+        has_chinese = bool(CHINESE_RE.search(result.markdown))
+        has_arabic = bool(ARABIC_RE.search(result.markdown))
+        has_hebrew = bool(HEBREW_RE.search(result.markdown))
         
         print("\n4. Language Detection:")
         if has_korean:
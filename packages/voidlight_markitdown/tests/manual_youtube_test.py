@@ -4,6 +4,7 @@ Manual YouTube Testing Tool
 Allows testing specific YouTube videos and inspecting the output
 """
 import os
+import re
 import sys
 import json
 import time
@@ -16,6 +17,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from voidlight_markitdown import VoidLightMarkItDown
 
+KOREAN_RE = re.compile(r"[\uac00-\ud7af]")
+
 
 class YouTubeTestTool:
     """Interactive YouTube testing tool"""
@@ -74,7 +77,7 @@ class YouTubeTestTool:
             print(f"- Has metadata: {'Yes' if '### Video Metadata' in content else 'No'}")
             
             # Check for Korean content
-            has_korean = any('\uac00' <= char <= '\ud7af' for char in content)
+            has_korean = bool(KOREAN_RE.search(content))
             if has_korean:
                 print(f"- Contains Korean text: Yes")
             
@@ -1,7 +1,9 @@
 import sys
 import io
+import mmap
 
-from typing import BinaryIO, Any
+from contextlib import contextmanager
+from typing import BinaryIO, Any, Iterator
 
 from .base import DocumentConverter, DocumentConverterResult
 from ..core.stream_info import StreamInfo
@@ -28,6 +30,75 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 ACCEPTED_FILE_EXTENSIONS = [".pdf"]
 
 
+class _MappedFile(io.RawIOBase):
+    """
+    Read-only file object over an mmap. pdfminer only accepts io.IOBase streams,
+    and mmap objects are not one.
+    """
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        self._view = memoryview(mapped)
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        # Copy straight from the mapping into the caller's buffer
+        chunk = self._view[self._pos:self._pos + len(buffer)]
+        size = len(chunk)
+        buffer[:size] = chunk
+        self._pos += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._view)
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self._pos = offset
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        # The mmap cannot be closed while this view still exports its buffer
+        self._view.release()
+        super().close()
+
+
+@contextmanager
+def _mapped_stream(file_stream: BinaryIO) -> Iterator[BinaryIO]:
+    """
+    Memory-map streams that read a regular file directly, so pdfminer's many seeks
+    and reads are served from the page cache instead of read() system calls. Other
+    streams are used as-is.
+    """
+    # Wrappers such as gzip.GzipFile also have a fileno(), but it refers to the
+    # underlying compressed file rather than the bytes the stream yields
+    raw = file_stream.raw if isinstance(file_stream, io.BufferedReader) else file_stream
+    if not isinstance(raw, io.FileIO):
+        yield file_stream
+        return
+
+    try:
+        mapped = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # An empty or unmappable file (e.g. a pipe)
+        yield file_stream
+        return
+
+    with mapped, _MappedFile(mapped) as mapped_file:
+        mapped_file.seek(file_stream.tell())
+        yield mapped_file  # type: ignore[misc]
+
+
 class PdfConverter(DocumentConverter, LoggingMixin):
     """
     Converts PDFs to Markdown. Most style information is ignored, so the results are essentially plain-text.
@@ -81,7 +152,8 @@ class PdfConverter(DocumentConverter, LoggingMixin):
         
         # Extract text from PDF
         self.log_debug("Extracting text from PDF using pdfminer")
-        text = pdfminer.high_level.extract_text(file_stream)
+        with _mapped_stream(file_stream) as pdf_stream:
+            text = pdfminer.high_level.extract_text(pdf_stream)
         
         # If Korean mode is enabled, we could add Korean-specific PDF processing here
         # For now, pdfminer should handle Korean text extraction reasonably well
@@ -3,48 +3,152 @@ Korean NLP library initialization and status checking.
 
 This module provides utilities to check the status of Korean NLP libraries
 and their dependencies.
+
+Dependency probes are lazy: constructing the initializer does no work, and
+each dependency is only checked the first time its status is requested.
+Probe results of the shared initializer are written to
+``~/.cache/voidlight_markitdown/nlp_status.json`` in one atomic replace when
+the process exits, so short-lived processes do not repeat them; set
+``VOIDLIGHT_NLP_REFRESH=1`` to ignore the cached results.
 """
 
+import asyncio
+import atexit
+import importlib.util
+import json
+import os
+import shutil
+import site
 import subprocess
 import sys
+import sysconfig
+import threading
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from functools import cached_property, lru_cache
+from importlib.metadata import PackageNotFoundError, version as metadata_version
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union
+
+
+CACHE_FILE = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'voidlight_markitdown' / 'nlp_status.json'
+REFRESH_ENV_VAR = 'VOIDLIGHT_NLP_REFRESH'
+
+# Seconds to wait for ``java -version`` before giving up
+JAVA_PROBE_TIMEOUT = 5.0
+
+# KoNLPy 'functional' value when the tagger imports but has not been run
+KONLPY_IMPORT_OK = 'import-ok'
+
+# Fixed status report lines
+_REPORT_HEADER = ("Korean NLP Status Report", "=" * 40)
+_JPYPE_YES = "JPype1: ✓"
+_JPYPE_NO = "JPype1: ✗"
+_INSTALLED_YES = "  Installed: ✓"
+_INSTALLED_NO = "  Installed: ✗"
+_FUNCTIONAL_YES = "  Functional: ✓"
+_FUNCTIONAL_NO = "  Functional: ✗"
+_FUNCTIONAL_IMPORT_OK = "  Functional: import ok (not verified)"
 
 
 @dataclass
 class KoreanNLPStatus:
-    """Status of Korean NLP libraries and dependencies."""
+    """Snapshot of Korean NLP library status, see KoreanNLPInitializer.to_dataclass()."""
     dependencies_status: Dict[str, Dict[str, Any]]
     java_available: bool
     java_version: Optional[str]
     recommendations: list
 
 
+@lru_cache(maxsize=None)
+def java_path() -> Optional[str]:
+    """Locate the java executable on PATH."""
+    return shutil.which('java')
+
+
 def check_java_installation() -> tuple[bool, Optional[str]]:
-    """Check if Java is installed and get version."""
+    """Check if Java is installed without launching a JVM.
+
+    The version is not determined here and is always None; use
+    ``_java_version_slow()`` when the version string is actually needed.
+    """
+    return java_path() is not None, None
+
+
+def _first_version_line(output: str) -> Optional[str]:
+    """Return the first line of ``java -version`` output."""
+    lines = output.strip().split('\n')
+    if lines:
+        return lines[0]
+    return None
+
+
+async def java_version_async() -> Optional[str]:
+    """Run ``java -version`` without blocking the event loop.
+
+    Returns the first line of its output, or ``None`` if Java is missing,
+    fails, or does not answer within ``JAVA_PROBE_TIMEOUT`` seconds.
+    """
+    java = java_path()
+    if java is None:
+        return None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            java, "-version",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), JAVA_PROBE_TIMEOUT)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+        if proc.returncode == 0:
+            # Java version is typically in stderr
+            return _first_version_line((stderr or stdout).decode(errors='replace'))
+        return None
+    except Exception:
+        return None
+
+
+def _java_version_slow() -> Optional[str]:
+    """Run ``java -version`` and return the first line of its output.
+
+    This blocks for up to ``JAVA_PROBE_TIMEOUT`` seconds; async callers should
+    await :func:`java_version_async` instead.
+    """
+    if java_path() is None:
+        return None
     try:
         result = subprocess.run(
-            ["java", "-version"],
+            [java_path(), "-version"],
             capture_output=True,
             text=True,
+            timeout=JAVA_PROBE_TIMEOUT,
             check=False
         )
         if result.returncode == 0:
-            # Java version is typically in stderr
-            version_output = result.stderr or result.stdout
-            # Extract version from output
-            lines = version_output.strip().split('\n')
-            if lines:
-                return True, lines[0]
-        return False, None
-    except FileNotFoundError:
-        return False, None
+            return _first_version_line(result.stderr or result.stdout)
+        return None
     except Exception:
-        return False, None
+        return None
 
 
-def check_konlpy_functional() -> bool:
-    """Check if KoNLPy is functional (Java dependencies met)."""
+def check_konlpy_functional() -> Union[bool, str]:
+    """Check that KoNLPy's tagger can be imported, without booting a JVM.
+
+    Returns ``'import-ok'`` when the import succeeds and False otherwise. Use
+    ``verify_konlpy_deep()`` to actually run a tagger.
+    """
+    try:
+        from konlpy.tag import Okt
+        return KONLPY_IMPORT_OK
+    except Exception:
+        return False
+
+
+def verify_konlpy_deep() -> bool:
+    """Check if KoNLPy is functional by starting the JVM and running Okt."""
     try:
         from konlpy.tag import Okt
         okt = Okt()
@@ -55,119 +159,400 @@ def check_konlpy_functional() -> bool:
         return False
 
 
-def get_korean_nlp_status() -> KoreanNLPStatus:
-    """Get comprehensive status of Korean NLP libraries."""
-    java_available, java_version = check_java_installation()
-    
-    dependencies_status = {
-        'kiwipiepy': {
-            'installed': False,
-            'functional': False,
-            'error': None
-        },
-        'konlpy': {
-            'installed': False,
-            'functional': False,
-            'error': None,
-            'java_required': True
-        },
-        'soynlp': {
-            'installed': False,
-            'functional': False,
-            'error': None
-        },
-        'hanspell': {
-            'installed': False,
-            'functional': False,
-            'error': None
-        },
-        'jamo': {
-            'installed': False,
-            'functional': False,
-            'error': None
-        },
-        'hanja': {
-            'installed': False,
-            'functional': False,
-            'error': None
-        }
+def _new_status(**extra: Any) -> Dict[str, Any]:
+    """Create an empty dependency status entry."""
+    status = {
+        'installed': False,
+        'functional': False,
+        'error': None
     }
-    
-    # Check kiwipiepy
+    status.update(extra)
+    return status
+
+
+def _check_optional_lib(lib_name: str) -> Dict[str, Any]:
+    """Check an optional library that is functional as soon as it is importable.
+
+    The module is located on sys.path but not executed, so the check does
+    not pay for the library's own imports.
+    """
+    status = _new_status()
+    if importlib.util.find_spec(lib_name) is not None:
+        status['installed'] = True
+        status['functional'] = True
+    return status
+
+
+def _mtime(path: Optional[str]) -> Optional[float]:
+    """Get the modification time of a path, or None if it is missing."""
+    if not path:
+        return None
     try:
-        import kiwipiepy
-        dependencies_status['kiwipiepy']['installed'] = True
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _environment_key() -> Dict[str, Any]:
+    """Describe the environment a cached probe result is valid for.
+
+    Installing or removing a package changes the site-packages directory
+    mtime (including the user site-packages used by ``pip install --user``),
+    and reinstalling Java changes the java binary mtime.
+    """
+    java = java_path()
+    paths = sysconfig.get_paths()
+    return {
+        'python_version': sys.version,
+        'sys_prefix': sys.prefix,
+        'java_path': java,
+        'java_mtime': _mtime(java),
+        'purelib_mtime': _mtime(paths.get('purelib')),
+        'platlib_mtime': _mtime(paths.get('platlib')),
+        'usersite_mtime': _mtime(site.getusersitepackages()),
+    }
+
+
+class _status_property(cached_property):
+    """A cached_property that schedules a cache write after a fresh probe.
+
+    Each probe is guarded by its own lock from ``_probe_locks`` rather than by
+    cached_property's lock (held across the getter on Python <= 3.11) or an
+    instance-wide lock, so a probe that reads another status, as
+    ``konlpy_status`` reads ``java_status``, always takes locks in the same order.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
         try:
-            from kiwipiepy import Kiwi
-            kiwi = Kiwi()
-            dependencies_status['kiwipiepy']['functional'] = True
-        except Exception as e:
-            dependencies_status['kiwipiepy']['error'] = str(e)
-    except ImportError:
-        pass
-    
-    # Check konlpy
-    try:
-        import konlpy
-        dependencies_status['konlpy']['installed'] = True
-        if java_available:
-            dependencies_status['konlpy']['functional'] = check_konlpy_functional()
-        else:
-            dependencies_status['konlpy']['error'] = "Java not found"
-    except ImportError:
-        pass
-    
-    # Check soynlp
-    try:
-        import soynlp
-        dependencies_status['soynlp']['installed'] = True
-        dependencies_status['soynlp']['functional'] = True
-    except ImportError:
-        pass
-    
-    # Check hanspell
-    try:
-        import hanspell
-        dependencies_status['hanspell']['installed'] = True
-        dependencies_status['hanspell']['functional'] = True
-    except ImportError:
-        pass
-    
-    # Check jamo
-    try:
-        import jamo
-        dependencies_status['jamo']['installed'] = True
-        dependencies_status['jamo']['functional'] = True
-    except ImportError:
-        pass
-    
-    # Check hanja
-    try:
-        import hanja
-        dependencies_status['hanja']['installed'] = True
-        dependencies_status['hanja']['functional'] = True
-    except ImportError:
-        pass
-    
-    # Generate recommendations
-    recommendations = []
-    
-    if not dependencies_status['kiwipiepy']['installed']:
-        recommendations.append("Install kiwipiepy for fast Korean tokenization: pip install kiwipiepy")
-    
-    if not java_available and dependencies_status['konlpy']['installed']:
-        recommendations.append("Install Java for KoNLPy functionality")
-    
-    if not any(d['functional'] for d in dependencies_status.values()):
-        recommendations.append("No Korean NLP libraries are functional. Install at least kiwipiepy or konlpy.")
-    
-    return KoreanNLPStatus(
-        dependencies_status=dependencies_status,
-        java_available=java_available,
-        java_version=java_version,
-        recommendations=recommendations
+            return instance.__dict__[self.attrname]
+        except KeyError:
+            pass
+        with instance._probe_locks[self.attrname]:
+            if self.attrname not in instance.__dict__:
+                instance.__dict__[self.attrname] = self.func(instance)
+                instance._mark_dirty()
+        return instance.__dict__[self.attrname]
+
+
+class KoreanNLPInitializer:
+    """Lazily probes Korean NLP libraries and their dependencies.
+
+    Every ``*_status`` property runs its probe on first access and memoizes
+    the result, so callers only pay for the checks they actually need.
+
+    Args:
+        cache_file: Optional JSON file to load earlier probe results from and
+            to save new ones to. Results are only reused when they were
+            recorded for the same environment.
+        refresh: Ignore results already stored in ``cache_file``.
+    """
+
+    DEPENDENCIES = ('kiwipiepy', 'konlpy', 'soynlp', 'hanspell', 'jamo', 'hanja')
+    OPTIONAL_LIBS = ('soynlp', 'hanspell', 'jamo', 'hanja')
+    STATUS_PROPERTIES = (
+        'java_status', 'java_version', 'jpype_status', 'kiwi_status', 'konlpy_status',
+        'soynlp_status', 'hanspell_status', 'jamo_status', 'hanja_status',
     )
 
+    def __init__(self, cache_file: Optional[Path] = None, refresh: bool = False):
+        # Guards the cache file; never held while a status property is read
+        self._lock = threading.RLock()
+        self._probe_locks = {name: threading.RLock() for name in self.STATUS_PROPERTIES}
+        self._cache_file = cache_file
+        self._cache_key: Optional[Dict[str, Any]] = None
+        self._dirty = False
+        if cache_file is not None and not refresh:
+            self._load_cache()
+
+    def _load_cache(self) -> None:
+        """Hydrate status properties from the cache file if it matches this environment."""
+        try:
+            with open(self._cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        self._cache_key = _environment_key()
+        if not isinstance(cached, dict) or cached.get('key') != self._cache_key:
+            return
+
+        for name, status in cached.get('status', {}).items():
+            if name in self.STATUS_PROPERTIES:
+                self.__dict__[name] = status
+
+    def _mark_dirty(self) -> None:
+        """Schedule a cache write at exit, so several probes cost one write."""
+        if self._cache_file is None:
+            return
+
+        with self._lock:
+            if not self._dirty:
+                self._dirty = True
+                atexit.register(self._save_cache)
+
+    def _save_cache(self) -> None:
+        """Atomically write every status probed so far to the cache file."""
+        if self._cache_file is None:
+            return
+
+        with self._lock:
+            self._dirty = False
+            if self._cache_key is None:
+                self._cache_key = _environment_key()
+            data = {
+                'key': self._cache_key,
+                'status': {name: self.__dict__[name] for name in self.STATUS_PROPERTIES if name in self.__dict__},
+            }
+            try:
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self._cache_file.with_suffix(f'.{os.getpid()}.tmp')
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                os.replace(tmp_file, self._cache_file)
+            except OSError:
+                pass
+
+    @_status_property
+    def java_status(self) -> Dict[str, Any]:
+        """Java runtime availability (required by KoNLPy); does not launch a JVM."""
+        available, _ = check_java_installation()
+        return {'installed': available, 'path': java_path()}
+
+    @_status_property
+    def java_version(self) -> Optional[str]:
+        """Java version string; runs ``java -version`` on first access."""
+        return _java_version_slow()
+
+    async def java_version_async(self) -> Optional[str]:
+        """Async counterpart of ``java_version`` for callers inside an event loop.
+
+        The probe runs without blocking the loop; its result is stored as the
+        ``java_version`` property value and persisted like any other probe.
+        """
+        if 'java_version' not in self.__dict__:
+            version = await java_version_async()
+            with self._probe_locks['java_version']:
+                self.__dict__.setdefault('java_version', version)
+            self._mark_dirty()
+        return self.__dict__['java_version']
+
+    @_status_property
+    def jpype_status(self) -> Dict[str, Any]:
+        """JPype1 availability (the bridge KoNLPy uses to talk to the JVM).
+
+        Only the installed distribution metadata is read; importing jpype would
+        load its native extension just to answer a status query.
+        """
+        status = _new_status(version=None)
+        try:
+            status['version'] = metadata_version('JPype1')
+            status['installed'] = True
+            status['functional'] = True
+        except PackageNotFoundError:
+            pass
+        return status
+
+    @_status_property
+    def kiwi_status(self) -> Dict[str, Any]:
+        """kiwipiepy availability.
+
+        Importing the ``Kiwi`` class proves the native extension loads; the
+        analyzer itself is not built here, since that loads its dictionary and
+        is left to the first real tokenization.
+        """
+        status = _new_status(version=None)
+        try:
+            from kiwipiepy import Kiwi  # noqa: F401
+            status['installed'] = True
+            status['functional'] = True
+            try:
+                status['version'] = metadata_version('kiwipiepy')
+            except PackageNotFoundError:
+                status['version'] = 'unknown'
+        except ImportError:
+            pass
+        except Exception as e:
+            status['installed'] = True
+            status['error'] = str(e)
+        return status
+
+    @_status_property
+    def konlpy_status(self) -> Dict[str, Any]:
+        """KoNLPy availability; only probes Java when KoNLPy is installed."""
+        status = _new_status(java_required=True)
+        try:
+            import konlpy
+            status['installed'] = True
+            if self.java_status['installed']:
+                status['functional'] = check_konlpy_functional()
+            else:
+                status['error'] = "Java not found"
+        except ImportError:
+            pass
+        return status
+
+    def verify_konlpy_deep(self) -> bool:
+        """Run KoNLPy's Okt tagger to confirm it really works.
+
+        This boots a JVM, so it is only done on request. The result replaces
+        the import-only check in ``konlpy_status``.
+        """
+        status = self.konlpy_status
+        with self._probe_locks['konlpy_status']:
+            if status['installed'] and status['functional'] == KONLPY_IMPORT_OK:
+                status['functional'] = verify_konlpy_deep()
+                self._mark_dirty()
+            return status['functional'] is True
+
+    @_status_property
+    def soynlp_status(self) -> Dict[str, Any]:
+        """soynlp availability."""
+        return _check_optional_lib('soynlp')
+
+    @_status_property
+    def hanspell_status(self) -> Dict[str, Any]:
+        """py-hanspell availability."""
+        return _check_optional_lib('hanspell')
+
+    @_status_property
+    def jamo_status(self) -> Dict[str, Any]:
+        """jamo availability."""
+        return _check_optional_lib('jamo')
+
+    @_status_property
+    def hanja_status(self) -> Dict[str, Any]:
+        """hanja availability."""
+        return _check_optional_lib('hanja')
+
+    def get_dependency_status(self, name: str) -> Dict[str, Any]:
+        """Get the status of a single dependency, probing only that one."""
+        if name == 'kiwipiepy':
+            return self.kiwi_status
+        if name not in self.DEPENDENCIES:
+            raise KeyError(name)
+        return getattr(self, f'{name}_status')
+
+    @property
+    def dependencies_status(self) -> Dict[str, Dict[str, Any]]:
+        """Status of every Korean NLP dependency (forces all probes)."""
+        return {name: self.get_dependency_status(name) for name in self.DEPENDENCIES}
+
+    @property
+    def java_available(self) -> bool:
+        return self.java_status['installed']
+
+    @property
+    def recommendations(self) -> List[str]:
+        """Installation recommendations based on the current status."""
+        recommendations = []
+
+        if not self.kiwi_status['installed']:
+            recommendations.append("Install kiwipiepy for fast Korean tokenization: pip install kiwipiepy")
+
+        if self.konlpy_status['installed'] and not self.java_available:
+            recommendations.append("Install Java for KoNLPy functionality")
+
+        if not any(d['functional'] for d in self.dependencies_status.values()):
+            recommendations.append("No Korean NLP libraries are functional. Install at least kiwipiepy or konlpy.")
+
+        return recommendations
+
+    def to_dataclass(self) -> KoreanNLPStatus:
+        """Snapshot the full status as a KoreanNLPStatus (forces all probes)."""
+        return KoreanNLPStatus(
+            dependencies_status=self.dependencies_status,
+            java_available=self.java_available,
+            java_version=self.java_version,
+            recommendations=self.recommendations,
+        )
+
+    def get_status_report(self) -> str:
+        """Build a human-readable status report."""
+        lines = list(_REPORT_HEADER)
+        lines.append("Python: " + sys.version.split()[0])
+        lines.append("Java: " + (self.java_version or 'unknown version') if self.java_available else "Java: not found")
+        lines.append(_JPYPE_YES if self.jpype_status['installed'] else _JPYPE_NO)
+        lines.append("")
+
+        for name, status in self.dependencies_status.items():
+            lines.append(name + ":")
+            lines.append(_INSTALLED_YES if status['installed'] else _INSTALLED_NO)
+            if status['functional'] == KONLPY_IMPORT_OK:
+                lines.append(_FUNCTIONAL_IMPORT_OK)
+            else:
+                lines.append(_FUNCTIONAL_YES if status['functional'] else _FUNCTIONAL_NO)
+            if status['error']:
+                lines.append(f"  Error: {status['error']}")
+
+        recommendations = self.recommendations
+        if recommendations:
+            lines.append("")
+            lines.append("Recommendations:")
+            for recommendation in recommendations:
+                lines.append(f"  - {recommendation}")
+
+        return '\n'.join(lines)
+
+    def get_installation_instructions(self) -> str:
+        """Build installation instructions for missing core libraries.
+
+        Only the kiwipiepy and KoNLPy probes are forced; the Java probe only
+        runs when KoNLPy is installed.
+        """
+        lines = []
+
+        if not self.kiwi_status['installed']:
+            lines.append("Kiwi (recommended, no Java required):")
+            lines.append("  pip install kiwipiepy")
+
+        if not self.konlpy_status['installed']:
+            lines.append("KoNLPy (requires Java):")
+            lines.append("  pip install konlpy JPype1")
+        elif not self.java_available:
+            lines.append("Java runtime (required by KoNLPy):")
+            lines.append("  macOS: brew install openjdk")
+            lines.append("  Ubuntu/Debian: sudo apt-get install openjdk-11-jdk")
+
+        if not lines:
+            return "All core Korean NLP libraries are installed."
+
+        return '\n'.join(lines)
+
+
+_initializer: Optional[KoreanNLPInitializer] = None
+_initializer_lock = threading.Lock()
+
+
+def get_korean_nlp_status(deep: bool = False) -> KoreanNLPInitializer:
+    """Get the shared Korean NLP status object.
+
+    No dependency is probed here; checks run lazily as the returned object's
+    status properties are read, and results cached on disk by an earlier
+    process are reused unless ``VOIDLIGHT_NLP_REFRESH=1`` is set.
+
+    Args:
+        deep: Also start the JVM and run KoNLPy's tagger instead of only
+            checking that it imports.
+    """
+    global _initializer
+    if _initializer is None:
+        with _initializer_lock:
+            if _initializer is None:
+                _initializer = KoreanNLPInitializer(
+                    cache_file=CACHE_FILE,
+                    refresh=os.environ.get(REFRESH_ENV_VAR) == '1',
+                )
+    if deep:
+        _initializer.verify_konlpy_deep()
+    return _initializer
+
+
+def print_status_report() -> None:
+    """Print the Korean NLP status report."""
+    print(get_korean_nlp_status().get_status_report())
+
 
 # Alias for backward compatibility
-init_korean_nlp = get_korean_nlp_status
\ No newline at end of file
+init_korean_nlp = get_korean_nlp_status
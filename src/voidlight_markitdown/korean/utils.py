@@ -1,48 +1,220 @@
 """Korean text processing utilities for voidlight_markitdown."""
 
+import importlib
+import importlib.util
 import re
+import threading
 import unicodedata
-from typing import Optional, Dict, Any, List, Tuple
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from charset_normalizer import from_bytes
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from .nlp import get_korean_nlp_status
 from ..utils.logging import get_logger, LoggingMixin, log_performance
 
-# Optional imports with fallbacks
-try:
+if TYPE_CHECKING:
+    import numpy as np
     from kiwipiepy import Kiwi
-    KIWI_AVAILABLE = True
-except ImportError:
-    KIWI_AVAILABLE = False
-    
-try:
     from konlpy.tag import Okt
-    KONLPY_AVAILABLE = True
-except ImportError:
-    KONLPY_AVAILABLE = False
-
-try:
-    from soynlp.normalizer import repeat_normalize
-    from soynlp.word import WordExtractor
-    SOYNLP_AVAILABLE = True
-except ImportError:
-    SOYNLP_AVAILABLE = False
-
-try:
-    from hanspell import spell_checker
-    HANSPELL_AVAILABLE = True
-except ImportError:
-    HANSPELL_AVAILABLE = False
-
-try:
-    import jamo
-    JAMO_AVAILABLE = True
-except ImportError:
-    JAMO_AVAILABLE = False
-
-try:
-    import hanja
-    HANJA_AVAILABLE = True
-except ImportError:
-    HANJA_AVAILABLE = False
+
+# Optional libraries are only located here and imported on first use (see
+# _optional_module), so importing this module does not pay for them; KoNLPy,
+# for one, pulls in JPype, and NumPy takes about 85 ms on its own.
+KIWI_AVAILABLE = importlib.util.find_spec('kiwipiepy') is not None
+KONLPY_AVAILABLE = importlib.util.find_spec('konlpy') is not None
+SOYNLP_AVAILABLE = importlib.util.find_spec('soynlp') is not None
+HANSPELL_AVAILABLE = importlib.util.find_spec('hanspell') is not None
+JAMO_AVAILABLE = importlib.util.find_spec('jamo') is not None
+HANJA_AVAILABLE = importlib.util.find_spec('hanja') is not None
+NUMPY_AVAILABLE = importlib.util.find_spec('numpy') is not None
+
+
+# Below this length the per-call NumPy setup costs more than a scalar loop
+_VECTORIZE_MIN_LENGTH = 64
+
+# Result caches for normalization and tokenization; only texts up to
+# _CACHEABLE_TEXT_LENGTH characters are cached so memory stays bounded
+_NORMALIZE_CACHE_SIZE = 4096
+_TOKENIZE_CACHE_SIZE = 8192
+_CACHEABLE_TEXT_LENGTH = 4096
+
+# Concurrent requests made by normalize_many when spell checking
+_SPELLCHECK_WORKERS = 8
+
+# Tokenizers are expensive to build, so one instance is shared by all processors
+_SHARED_KIWI = None
+_SHARED_OKT = None
+_SHARED_TOKENIZER_LOCK = threading.Lock()
+
+# Precompiled patterns shared by the text processing methods
+# \s already matches the Unicode space variants; U+180E lost that property in Unicode 6.3
+_WS_RE = re.compile(r'[\s\u180e]+')
+_KO_LINEBREAK_RE = re.compile(r'([가-힣])\n([가-힣])')
+_EXCESS_LINEBREAK_RE = re.compile(r'\n{3,}')
+_HANJA_RE = re.compile(r'[\u4e00-\u9fff\u3400-\u4dbf\uf900-\ufaff]')
+_CONJOINING_JAMO_RE = re.compile(r'[\u1100-\u11ff\ua960-\ua97f\ud7b0-\ud7ff]')
+_LATIN_RE = re.compile(r'[a-zA-Z]')
+_LATIN_WORD_RE = re.compile(r'^[a-zA-Z]+$')
+_MOJIBAKE_RE = re.compile(r'[�占쏙옙]')
+
+# Common mojibake patterns fixed by normalize_korean_text
+_MOJIBAKE_REPLACEMENTS = {
+    '占쏙옙': '?',  # Common replacement for unknown characters
+    '�': '?',      # Unicode replacement character
+    '째': 'ㅉ',     # Common misencoding
+    '찮': 'ㅊ',     # Common misencoding
+}
+
+# Deletes zero-width characters and fixes single-character mojibake in one pass
+_NORMALIZE_TABLE = str.maketrans({
+    **dict.fromkeys((0x200B, 0x200C, 0x200D, 0xFEFF)),
+    **{pattern: fix for pattern, fix in _MOJIBAKE_REPLACEMENTS.items() if len(pattern) == 1},
+})
+
+# Only multi-character mojibake patterns are left for a regex scan
+_MOJIBAKE_SUB_RE = re.compile(
+    '|'.join(re.escape(pattern) for pattern in _MOJIBAKE_REPLACEMENTS if len(pattern) > 1)
+)
+_SENTENCE_END_CHARS = '.!?。！？…'  # Each one ends a sentence for sentence_count
+_SENTENCE_SPLIT_RE = re.compile(r'([.!?。！？…])\s*')
+_QUOTED_SENTENCE_END_RE = re.compile(r'([.!?。！？…])(["\'])\s*')
+
+# Sentence endings used by analyze_formality
+_FORMAL_ENDING_RE = re.compile(
+    r'(?:습니다|입니다|습니까|입니까|세요|어요|아요|십니까|십니다)$'
+)
+_INFORMAL_ENDING_RE = re.compile(
+    r'(?:다|냐|어|아|지|야|네|군|구나|자|라)$'
+)
+
+
+def _build_bmp_table(ranges: Tuple[Tuple[int, int], ...]) -> bytes:
+    """Build a 64 KiB table holding 1 for every BMP code point inside ranges."""
+    table = bytearray(0x10000)
+    for start, end in ranges:
+        end = min(end, 0xFFFF)
+        if start <= end:
+            table[start:end + 1] = b'\x01' * (end - start + 1)
+    return bytes(table)
+
+
+@lru_cache(maxsize=None)
+def _optional_module(name: str) -> Any:
+    """Import an optional library on first use; None if it fails to import."""
+    try:
+        return importlib.import_module(name)
+    except Exception:
+        return None
+
+
+def _use_numpy(text: str) -> bool:
+    """Whether text is long enough for the NumPy path and NumPy actually imports.
+
+    find_spec only shows that NumPy is installed; a broken wheel still fails
+    on import, in which case callers use their scalar fallback.
+    """
+    return (
+        NUMPY_AVAILABLE
+        and len(text) >= _VECTORIZE_MIN_LENGTH
+        and _optional_module('numpy') is not None
+    )
+
+
+@lru_cache(maxsize=_NORMALIZE_CACHE_SIZE)
+def _normalize_text(text: str, spellcheck: bool = False, normalize_archaic: bool = False) -> str:
+    """Pure normalization pipeline behind KoreanTextProcessor.normalize_korean_text."""
+    # Step 1: Normalize to NFC form
+    text = unicodedata.normalize('NFC', text)
+    
+    # Step 2: Remove zero-width characters and fix single-character mojibake
+    text = text.translate(_NORMALIZE_TABLE)
+    
+    # Step 3: Collapse whitespace runs, Unicode space variants included
+    text = _WS_RE.sub(' ', text)
+    
+    # Step 4: Fix multi-character mojibake patterns
+    text = _MOJIBAKE_SUB_RE.sub(lambda match: _MOJIBAKE_REPLACEMENTS[match.group()], text)
+    
+    # Step 5: Normalize repeated characters if soynlp is available
+    if SOYNLP_AVAILABLE:
+        try:
+            text = _optional_module('soynlp.normalizer').repeat_normalize(text, num_repeats=2)
+        except:
+            pass
+    
+    # Step 6: Apply spell checking if requested, available and text is not too long
+    # (hanspell sends the text to an online service, so it is opt-in)
+    if spellcheck and HANSPELL_AVAILABLE and len(text) < 500:
+        try:
+            result = _optional_module('hanspell.spell_checker').check(text)
+            if result.checked:
+                text = result.checked
+        except:
+            pass
+    
+    # Step 7: Decompose and recompose archaic Hangul if requested and jamo is available
+    # (after NFC this is an identity for modern Hangul, so only texts that still
+    # contain conjoining jamo are passed through jamo)
+    if normalize_archaic and JAMO_AVAILABLE and _CONJOINING_JAMO_RE.search(text):
+        try:
+            # This helps normalize old-style Korean text
+            jamo = _optional_module('jamo')
+            decomposed = jamo.h2j(text)
+            text = jamo.j2h(decomposed)
+        except:
+            pass
+    
+    return text.strip()
+
+
+@lru_cache(maxsize=_TOKENIZE_CACHE_SIZE)
+def _tokenize_text(
+    kiwi: Optional["Kiwi"], okt: Optional["Okt"], text: str, normalize: bool
+) -> Tuple[Tuple[str, str], ...]:
+    """Tokenizer behind KoreanTextProcessor.tokenize; returns an immutable result.
+
+    The cache is keyed on the shared tokenizer instances rather than on a
+    processor, so it does not keep processors alive.
+    """
+    if kiwi:
+        try:
+            result = kiwi.tokenize(text)
+            return tuple((token.form, token.tag) for token in result)
+        except Exception as e:
+            get_logger(f"{__name__}.KoreanTextProcessor").debug(f"Kiwi tokenization failed: {e}")
+    
+    if okt:
+        try:
+            return tuple(okt.pos(text, norm=normalize, stem=False))
+        except Exception as e:
+            get_logger(f"{__name__}.KoreanTextProcessor").debug(f"Okt tokenization failed: {e}")
+    
+    # Fallback: simple whitespace tokenization with basic POS guessing
+    tokens = []
+    for token in text.split():
+        if KoreanTextProcessor.is_korean_char(token[0] if token else ''):
+            # Basic POS tagging for Korean
+            if token.endswith(('다', '요', '니다', '습니다')):
+                pos = 'VV'  # Verb
+            elif token.endswith(('은', '는', '이', '가', '을', '를')):
+                pos = 'JK'  # Particle
+            else:
+                pos = 'NN'  # Noun (default)
+        else:
+            pos = 'SL' if _LATIN_WORD_RE.match(token) else 'SY'
+        tokens.append((token, pos))
+    
+    return tuple(tokens)
+
+
+@lru_cache(maxsize=None)
+def _hanja_reading(char: str) -> str:
+    """Hangul reading of a single Hanja character, or the character itself."""
+    try:
+        return _optional_module('hanja').translate(char, 'substitution')
+    except:
+        return char
 
 
 class KoreanTextProcessor(LoggingMixin):
@@ -60,6 +232,20 @@ class KoreanTextProcessor(LoggingMixin):
     CJK_EXTENSION_A = (0x3400, 0x4DBF)
     CJK_COMPATIBILITY = (0xF900, 0xFAFF)
     
+    KOREAN_RANGES = (
+        HANGUL_SYLLABLES,
+        HANGUL_JAMO,
+        HANGUL_COMPATIBILITY_JAMO,
+        HANGUL_JAMO_EXTENDED_A,
+        HANGUL_JAMO_EXTENDED_B,
+    )
+    HANJA_RANGES = (CJK_UNIFIED, CJK_EXTENSION_A, CJK_COMPATIBILITY)
+    
+    # Branch-free lookups for is_korean_char and is_hanja_char; every range lies in the BMP
+    _KOREAN_BMP = _build_bmp_table(KOREAN_RANGES)
+    _HANJA_BMP = _build_bmp_table(HANJA_RANGES)
+    _SENTENCE_END_BMP = _build_bmp_table(tuple((ord(char), ord(char)) for char in _SENTENCE_END_CHARS))
+    
     # Common Korean encoding mappings
     ENCODING_PRIORITY = [
         'utf-8',
@@ -73,51 +259,91 @@ class KoreanTextProcessor(LoggingMixin):
     ]
     
     def __init__(self):
-        """Initialize Korean text processor with available NLP tools."""
-        self.kiwi = None
-        self.okt = None
+        """Initialize Korean text processor with available NLP tools.
+
+        Tokenizers are not built here; ``kiwi`` and ``okt`` construct them on
+        first use, and the instances are shared by every processor.
+        """
+        self._kiwi = None
+        self._kiwi_loaded = False
+        self._okt = None
+        self._okt_loaded = False
         self.nlp_status = get_korean_nlp_status()
         
         self.log_info("Initializing Korean text processor")
         
-        # Initialize Kiwi if available (preferred for performance)
-        if KIWI_AVAILABLE:
-            try:
-                self.kiwi = Kiwi(num_workers=2)
-                # Add common proper nouns and terms
-                self._add_kiwi_user_words()
-                self.log_info("Kiwi tokenizer initialized successfully")
-            except Exception as e:
-                self.log_warning(f"Failed to initialize Kiwi: {e}", exc_info=True)
-                self.kiwi = None
-        
-        # Fallback to KoNLPy if Kiwi is not available
-        if not self.kiwi and KONLPY_AVAILABLE:
-            try:
-                # Check if Java dependencies are met
-                if self.nlp_status.dependencies_status['konlpy'].get('functional', False):
-                    self.okt = Okt()
-                    self.log_info("Okt tokenizer initialized as fallback")
-                else:
-                    self.log_warning("KoNLPy available but Java dependencies not met")
-            except Exception as e:
-                self.log_warning(f"Failed to initialize Okt: {e}", exc_info=True)
-                self.okt = None
-        
         # Log initialization status
         self._log_initialization_status()
     
+    @property
+    def kiwi(self) -> Optional["Kiwi"]:
+        """Kiwi tokenizer (preferred for performance), or None if unavailable."""
+        if not self._kiwi_loaded:
+            self._kiwi = self._load_kiwi()
+            self._kiwi_loaded = True
+        return self._kiwi
+    
+    @property
+    def okt(self) -> Optional["Okt"]:
+        """KoNLPy Okt tokenizer, used only when Kiwi is not available."""
+        if not self._okt_loaded:
+            self._okt = self._load_okt()
+            self._okt_loaded = True
+        return self._okt
+    
+    def _load_kiwi(self) -> Optional["Kiwi"]:
+        """Return the shared Kiwi instance, building it on first use."""
+        global _SHARED_KIWI
+        if not KIWI_AVAILABLE:
+            return None
+        
+        with _SHARED_TOKENIZER_LOCK:
+            if _SHARED_KIWI is None:
+                try:
+                    kiwi = _optional_module('kiwipiepy').Kiwi(num_workers=2)
+                    # Add common proper nouns and terms
+                    self._add_kiwi_user_words(kiwi)
+                    # Warm up so the model is loaded before the first real call
+                    kiwi.tokenize("워밍업")
+                    _SHARED_KIWI = kiwi
+                    self.log_info("Kiwi tokenizer initialized successfully")
+                except Exception as e:
+                    self.log_warning(f"Failed to initialize Kiwi: {e}", exc_info=True)
+            return _SHARED_KIWI
+    
+    def _load_okt(self) -> Optional["Okt"]:
+        """Return the shared Okt instance if Kiwi is unavailable, building it on first use."""
+        global _SHARED_OKT
+        if self.kiwi or not KONLPY_AVAILABLE:
+            return None
+        
+        with _SHARED_TOKENIZER_LOCK:
+            if _SHARED_OKT is None:
+                try:
+                    # Check if Java dependencies are met
+                    if self.nlp_status.konlpy_status.get('functional', False):
+                        okt = _optional_module('konlpy.tag').Okt()
+                        # Warm up so the JVM-side tagger is ready before the first real call
+                        okt.pos("워밍업")
+                        _SHARED_OKT = okt
+                        self.log_info("Okt tokenizer initialized as fallback")
+                    else:
+                        self.log_warning("KoNLPy available but Java dependencies not met")
+                except Exception as e:
+                    self.log_warning(f"Failed to initialize Okt: {e}", exc_info=True)
+            return _SHARED_OKT
+    
     def _log_initialization_status(self):
         """Log the initialization status of Korean NLP components."""
         status_parts = []
         
-        if self.kiwi:
+        if KIWI_AVAILABLE:
             status_parts.append("Kiwi")
-        if self.okt:
+        if KONLPY_AVAILABLE:
             status_parts.append("Okt")
             
         if status_parts:
-            self.log_info(f"Korean NLP initialized with: {', '.join(status_parts)}")
+            self.log_info(f"Korean NLP tokenizers available (loaded on first use): {', '.join(status_parts)}")
         else:
             self.log_warning("No Korean NLP tokenizers available - using fallback methods")
             
@@ -135,11 +361,8 @@ class KoreanTextProcessor(LoggingMixin):
         if optional_status:
             self.log_debug(f"Optional Korean modules available: {', '.join(optional_status)}")
     
-    def _add_kiwi_user_words(self):
+    def _add_kiwi_user_words(self, kiwi: "Kiwi"):
         """Add common user words to Kiwi dictionary."""
-        if not self.kiwi:
-            return
-            
         # Common IT/technical terms
         tech_terms = [
             ('인공지능', 'NNP'),
@@ -154,7 +377,7 @@ class KoreanTextProcessor(LoggingMixin):
         
         for word, tag in tech_terms:
             try:
-                self.kiwi.add_user_word(word, tag, 5.0)  # Add with default score
+                kiwi.add_user_word(word, tag, 5.0)  # Add with default score
             except Exception as e:
                 self.log_debug(f"Failed to add user word '{word}': {e}")
     
@@ -165,15 +388,7 @@ class KoreanTextProcessor(LoggingMixin):
             return False
         
         code = ord(char[0])
-        
-        # Check various Korean Unicode blocks
-        return (
-            (KoreanTextProcessor.HANGUL_SYLLABLES[0] <= code <= KoreanTextProcessor.HANGUL_SYLLABLES[1]) or
-            (KoreanTextProcessor.HANGUL_JAMO[0] <= code <= KoreanTextProcessor.HANGUL_JAMO[1]) or
-            (KoreanTextProcessor.HANGUL_COMPATIBILITY_JAMO[0] <= code <= KoreanTextProcessor.HANGUL_COMPATIBILITY_JAMO[1]) or
-            (KoreanTextProcessor.HANGUL_JAMO_EXTENDED_A[0] <= code <= KoreanTextProcessor.HANGUL_JAMO_EXTENDED_A[1]) or
-            (KoreanTextProcessor.HANGUL_JAMO_EXTENDED_B[0] <= code <= KoreanTextProcessor.HANGUL_JAMO_EXTENDED_B[1])
-        )
+        return code < 0x10000 and bool(KoreanTextProcessor._KOREAN_BMP[code])
     
     @staticmethod
     def is_hanja_char(char: str) -> bool:
@@ -182,12 +397,28 @@ class KoreanTextProcessor(LoggingMixin):
             return False
         
         code = ord(char[0])
-        
-        return (
-            (KoreanTextProcessor.CJK_UNIFIED[0] <= code <= KoreanTextProcessor.CJK_UNIFIED[1]) or
-            (KoreanTextProcessor.CJK_EXTENSION_A[0] <= code <= KoreanTextProcessor.CJK_EXTENSION_A[1]) or
-            (KoreanTextProcessor.CJK_COMPATIBILITY[0] <= code <= KoreanTextProcessor.CJK_COMPATIBILITY[1])
-        )
+        return code < 0x10000 and bool(KoreanTextProcessor._HANJA_BMP[code])
+    
+    @staticmethod
+    def _code_points(text: str) -> "np.ndarray":
+        """View text as a NumPy array with one code point per character."""
+        # surrogatepass keeps lone surrogates so the array length matches len(text)
+        np = _optional_module('numpy')
+        return np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    
+    @staticmethod
+    def _bmp_index(codes: "np.ndarray") -> "np.ndarray":
+        """Clamp code points to valid BMP table indices.
+
+        Code points above the BMP map to U+FFFF, which is in no table.
+        """
+        return _optional_module('numpy').minimum(codes, 0xFFFF)
+    
+    @staticmethod
+    def _count_in_table(index: "np.ndarray", table: bytes) -> int:
+        """Count indices whose BMP lookup table entry is set."""
+        np = _optional_module('numpy')
+        return int(np.count_nonzero(np.frombuffer(table, dtype=np.uint8)[index]))
     
     @staticmethod
     def detect_korean_ratio(text: str) -> float:
@@ -195,71 +426,63 @@ class KoreanTextProcessor(LoggingMixin):
         if not text:
             return 0.0
         
-        korean_chars = sum(1 for char in text if KoreanTextProcessor.is_korean_char(char))
-        total_chars = len(text)
+        if _use_numpy(text):
+            codes = KoreanTextProcessor._code_points(text)
+            index = KoreanTextProcessor._bmp_index(codes)
+            return KoreanTextProcessor._count_in_table(index, KoreanTextProcessor._KOREAN_BMP) / codes.size
+        
+        # Every Korean range lies in the BMP, so one table lookup per character suffices
+        table = KoreanTextProcessor._KOREAN_BMP
+        korean_chars = sum(table[code] for code in map(ord, text) if code < 0x10000)
         
-        return korean_chars / total_chars if total_chars > 0 else 0.0
+        return korean_chars / len(text)
     
-    def normalize_korean_text(self, text: str) -> str:
+    def normalize_korean_text(
+        self,
+        text: str,
+        *,
+        spellcheck: bool = False,
+        normalize_archaic: bool = False,
+    ) -> str:
         """Normalize Korean text for better processing.
         
         - Normalize Unicode (NFC)
         - Fix common encoding issues
         - Normalize whitespace
         - Remove zero-width characters
-        - Apply spell checking if available
+        - Apply spell checking if requested and available
+        - Recompose archaic Hangul with jamo if requested and available
+        
+        Args:
+            text: Text to normalize
+            spellcheck: Whether to run py-hanspell, which makes a network
+                request for every text under 500 characters
+            normalize_archaic: Whether to recompose old-style Hangul jamo
+                sequences that NFC leaves decomposed
         """
         if not text:
             return text
         
         with log_performance(self.logger, "normalize_korean_text", text_length=len(text)):
-            # Step 1: Normalize to NFC form
-            text = unicodedata.normalize('NFC', text)
-            
-            # Step 2: Remove zero-width characters
-            text = re.sub(r'[\u200b\u200c\u200d\ufeff]', '', text)
-            
-            # Step 3: Normalize whitespace
-            text = re.sub(r'\s+', ' ', text)
-            text = re.sub(r'[\u00A0\u1680\u180E\u2000-\u200A\u202F\u205F\u3000]', ' ', text)
-            
-            # Step 4: Fix common mojibake patterns
-            mojibake_patterns = {
-                '占쏙옙': '?',  # Common replacement for unknown characters
-                '�': '?',      # Unicode replacement character
-                '째': 'ㅉ',     # Common misencoding
-                '찮': 'ㅊ',     # Common misencoding
-            }
-            
-            for pattern, replacement in mojibake_patterns.items():
-                text = text.replace(pattern, replacement)
-            
-            # Step 5: Normalize repeated characters if soynlp is available
-            if SOYNLP_AVAILABLE:
-                try:
-                    text = repeat_normalize(text, num_repeats=2)
-                except:
-                    pass
-            
-            # Step 6: Apply spell checking if available and text is not too long
-            if HANSPELL_AVAILABLE and len(text) < 500:
-                try:
-                    result = spell_checker.check(text)
-                    if result.checked:
-                        text = result.checked
-                except:
-                    pass
-            
-            # Step 7: Decompose and recompose Hangul if jamo is available
-            if JAMO_AVAILABLE:
-                try:
-                    # This helps normalize old-style Korean text
-                    decomposed = jamo.h2j(text)
-                    text = jamo.j2h(decomposed)
-                except:
-                    pass
-            
-            return text.strip()
+            # Repeated headers, footers and boilerplate hit the cache; whole
+            # documents are normalized directly so they cannot pin memory
+            if len(text) <= _CACHEABLE_TEXT_LENGTH:
+                return _normalize_text(text, spellcheck, normalize_archaic)
+            return _normalize_text.__wrapped__(text, spellcheck, normalize_archaic)
+    
+    def normalize_many(self, texts: List[str], *, spellcheck: bool = False) -> List[str]:
+        """Normalize several texts, such as the pages of a document.
+        
+        Spell checking is network-bound, so with ``spellcheck=True`` the texts
+        are checked concurrently.
+        """
+        if spellcheck and HANSPELL_AVAILABLE:
+            with ThreadPoolExecutor(max_workers=_SPELLCHECK_WORKERS) as executor:
+                return list(executor.map(
+                    lambda text: self.normalize_korean_text(text, spellcheck=True), texts
+                ))
+        
+        return [self.normalize_korean_text(text) for text in texts]
     
     def fix_korean_line_breaks(self, text: str) -> str:
         """Fix line break issues in Korean text.
@@ -285,14 +508,10 @@ class KoreanTextProcessor(LoggingMixin):
             # Otherwise replace with space
             return prev_char + ' ' + next_char
         
-        text = re.sub(
-            r'([가-힣])\n([가-힣])',
-            replace_break,
-            text
-        )
+        text = _KO_LINEBREAK_RE.sub(replace_break, text)
         
         # Remove excessive line breaks
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _EXCESS_LINEBREAK_RE.sub('\n\n', text)
         
         return text
     
@@ -308,39 +527,35 @@ class KoreanTextProcessor(LoggingMixin):
         """
         if not text:
             return []
-            
+        
         if normalize:
             text = self.normalize_korean_text(text)
-            
-        if self.kiwi:
-            try:
-                result = self.kiwi.tokenize(text)
-                return [(token.form, token.tag) for token in result]
-            except Exception as e:
-                self.log_debug(f"Kiwi tokenization failed: {e}")
         
-        if self.okt:
+        # Only one of kiwi and okt is ever set, and both are shared by all processors
+        if len(text) <= _CACHEABLE_TEXT_LENGTH:
+            return list(_tokenize_text(self.kiwi, self.okt, text, normalize))
+        return list(_tokenize_text.__wrapped__(self.kiwi, self.okt, text, normalize))
+    
+    def tokenize_batch(self, texts: List[str], normalize: bool = True) -> List[List[Tuple[str, str]]]:
+        """Tokenize several texts, such as the pages of a document.
+        
+        With Kiwi all texts go through a single call, which spreads the work
+        over Kiwi's worker threads; otherwise each text is tokenized in turn.
+        
+        Returns:
+            One list of (token, pos_tag) tuples per input text.
+        """
+        if self.kiwi:
+            batch = [self.normalize_korean_text(text) for text in texts] if normalize else list(texts)
             try:
-                return self.okt.pos(text, norm=normalize, stem=False)
+                return [
+                    [(token.form, token.tag) for token in result] if text else []
+                    for text, result in zip(batch, self.kiwi.tokenize(batch))
+                ]
             except Exception as e:
-                self.log_debug(f"Okt tokenization failed: {e}")
-        
-        # Fallback: simple whitespace tokenization with basic POS guessing
-        tokens = []
-        for token in text.split():
-            if self.is_korean_char(token[0] if token else ''):
-                # Basic POS tagging for Korean
-                if token.endswith(('다', '요', '니다', '습니다')):
-                    pos = 'VV'  # Verb
-                elif token.endswith(('은', '는', '이', '가', '을', '를')):
-                    pos = 'JK'  # Particle
-                else:
-                    pos = 'NN'  # Noun (default)
-            else:
-                pos = 'SL' if re.match(r'^[a-zA-Z]+$', token) else 'SY'
-            tokens.append((token, pos))
+                self.log_debug(f"Kiwi batch tokenization failed: {e}")
         
-        return tokens
+        return [self.tokenize(text, normalize) for text in texts]
     
     def extract_nouns(self, text: str) -> List[str]:
         """Extract nouns from Korean text."""
@@ -369,26 +584,27 @@ class KoreanTextProcessor(LoggingMixin):
             return text
         
         try:
-            # Convert character by character
-            result = []
-            for char in text:
-                if self.is_hanja_char(char):
-                    try:
-                        hangul = hanja.translate(char, 'substitution')
-                        result.append(hangul if hangul != char else char)
-                    except:
-                        result.append(char)
-                else:
-                    result.append(char)
-            
-            return ''.join(result)
+            # Look up each distinct Hanja once, then substitute in a single pass
+            table = {ord(char): _hanja_reading(char) for char in set(_HANJA_RE.findall(text))}
+            return text.translate(table)
         except:
             return text
     
     def extract_korean_metadata(self, text: str) -> Dict[str, Any]:
         """Extract metadata about Korean text content."""
+        if _use_numpy(text):
+            # Convert and clamp once; every count is a table gather over the same index
+            index = self._bmp_index(self._code_points(text))
+            korean_ratio = self._count_in_table(index, self._KOREAN_BMP) / index.size
+            hanja_chars = self._count_in_table(index, self._HANJA_BMP)
+            sentence_count = self._count_in_table(index, self._SENTENCE_END_BMP)
+        else:
+            korean_ratio = self.detect_korean_ratio(text)
+            hanja_chars = len(_HANJA_RE.findall(text))
+            sentence_count = sum(map(text.count, _SENTENCE_END_CHARS))
+        
         metadata = {
-            'korean_ratio': self.detect_korean_ratio(text),
+            'korean_ratio': korean_ratio,
             'has_korean': False,
             'has_hanja': False,
             'has_mixed_script': False,
@@ -403,39 +619,42 @@ class KoreanTextProcessor(LoggingMixin):
             metadata['has_korean'] = True
         
         # Check for Hanja
-        hanja_chars = sum(1 for char in text if self.is_hanja_char(char))
         if hanja_chars > 0:
             metadata['has_hanja'] = True
             metadata['hanja_ratio'] = hanja_chars / len(text) if len(text) > 0 else 0
         
         # Check for mixed scripts
-        if metadata['has_korean'] and re.search(r'[a-zA-Z]', text):
+        if metadata['has_korean'] and _LATIN_RE.search(text):
             metadata['has_mixed_script'] = True
         
         # Check for potential encoding issues
-        if re.search(r'[�占쏙옙]', text) or '?' * 3 in text:
+        if _MOJIBAKE_RE.search(text) or '?' * 3 in text:
             metadata['detected_encoding_issues'] = True
         
-        # Count sentences (Korean sentence endings)
-        sentence_endings = r'[.!?。！？…]\s*'
-        metadata['sentence_count'] = len(re.findall(sentence_endings, text))
+        # Count sentences (Korean sentence endings), counted above with the other classes
+        metadata['sentence_count'] = sentence_count
         
         # Tokenize and count words/nouns
         if self.kiwi or self.okt:
             tokens = self.tokenize(text)
             metadata['word_count'] = len(tokens)
             
-            nouns = self.extract_nouns(text)
+            if self.kiwi:
+                # Kiwi noun tags all start with 'N'; reuse the tokens instead of a second pass.
+                # If Kiwi failed these are whitespace fallback tokens, so drop single
+                # characters and punctuation that only carry a guessed noun tag.
+                nouns = [
+                    form for form, tag in tokens
+                    if tag.startswith('N') and len(form.strip()) > 1
+                ]
+            else:
+                nouns = self.extract_nouns(text)
             metadata['noun_count'] = len(nouns)
             
             # Get top nouns
             if nouns:
-                noun_freq = {}
-                for noun in nouns:
-                    noun_freq[noun] = noun_freq.get(noun, 0) + 1
-                
-                top_nouns = sorted(noun_freq.items(), key=lambda x: x[1], reverse=True)[:10]
-                metadata['top_nouns'] = [noun for noun, _ in top_nouns]
+                noun_freq = Counter(nouns)
+                metadata['top_nouns'] = [noun for noun, _ in noun_freq.most_common(10)]
         else:
             # Fallback word count
             metadata['word_count'] = len(text.split())
@@ -445,28 +664,20 @@ class KoreanTextProcessor(LoggingMixin):
     @staticmethod
     def smart_decode(data: bytes) -> str:
         """Smart decode bytes with Korean encoding detection."""
-        # Try encodings in priority order
-        for encoding in KoreanTextProcessor.ENCODING_PRIORITY:
+        # Fast path: a strict decode validates UTF-8 at C speed and cannot produce
+        # replacement characters, so a successful result needs no further checks.
+        # NUL bytes usually mean UTF-16, which happens to be valid UTF-8 for ASCII text.
+        if b'\x00' not in data:
             try:
-                decoded = data.decode(encoding)
-                # Verify the decoding by checking for replacement characters
-                if '�' not in decoded and '占쏙옙' not in decoded:
-                    # Additional check: if it's supposed to be Korean, verify Korean content
-                    if KoreanTextProcessor.detect_korean_ratio(decoded) > 0.1:
-                        return decoded
-                    elif not any(ord(c) > 127 for c in decoded):
-                        # Pure ASCII is likely correct
-                        return decoded
-            except (UnicodeDecodeError, LookupError):
-                continue
-        
-        # If no encoding worked perfectly, try again with error handling
-        for encoding in KoreanTextProcessor.ENCODING_PRIORITY:
-            try:
-                decoded = data.decode(encoding, errors='replace')
-                return decoded
-            except LookupError:
-                continue
+                return data.decode('utf-8')
+            except UnicodeDecodeError:
+                pass
+
+        # A single detection pass restricted to the encodings Korean documents use,
+        # instead of fully decoding the buffer once per candidate encoding
+        best = from_bytes(data, cp_isolation=KoreanTextProcessor.ENCODING_PRIORITY).best()
+        if best is not None:
+            return str(best)
         
         # Final fallback
         return data.decode('utf-8', errors='replace')
@@ -476,12 +687,14 @@ class KoreanTextProcessor(LoggingMixin):
         if not text:
             return text
         
-        # Fix line breaks
-        text = self.fix_korean_line_breaks(text)
-        
-        # Normalize if requested
         if normalize:
+            # Normalization collapses every whitespace run, newlines included, to a
+            # single space, which already covers what the line-break fix does.
+            # Skipping that pass saves a full scan and copy of the document.
             text = self.normalize_korean_text(text)
+        else:
+            # Fix line breaks
+            text = self.fix_korean_line_breaks(text)
         
         # Convert Hanja to Hangul if configured
         # (This is optional and depends on use case)
@@ -503,26 +716,22 @@ class KoreanTextProcessor(LoggingMixin):
                 self.log_debug(f"Kiwi sentence segmentation failed: {e}")
         
         # Enhanced rule-based segmentation
-        # Korean sentence endings with context
-        sentence_endings = r'([.!?。！？…])\s*'
-        
         # Special handling for quotes and parentheses
-        text = re.sub(r'([.!?。！？…])(["\'])\s*', r'\1\2\n', text)
+        text = _QUOTED_SENTENCE_END_RE.sub(r'\1\2\n', text)
         
-        sentences = re.split(sentence_endings, text)
-        
-        # Reconstruct sentences with their endings
+        # Slice at each sentence ending, keeping the ending with its sentence
         result = []
-        for i in range(0, len(sentences) - 1, 2):
-            if i + 1 < len(sentences):
-                sent = sentences[i] + sentences[i + 1]
-                sent = sent.strip()
-                if sent:
-                    result.append(sent)
+        start = 0
+        for match in _SENTENCE_SPLIT_RE.finditer(text):
+            sent = text[start:match.end(1)].strip()
+            if sent:
+                result.append(sent)
+            start = match.end()
         
         # Add last sentence if it doesn't have an ending
-        if len(sentences) % 2 == 1 and sentences[-1].strip():
-            result.append(sentences[-1].strip())
+        sent = text[start:].strip()
+        if sent:
+            result.append(sent)
         
         return result if result else [text]
     
@@ -536,22 +745,15 @@ class KoreanTextProcessor(LoggingMixin):
         if not nouns:
             return []
         
-        # Count frequency
-        noun_freq = {}
-        for noun in nouns:
-            # Skip single character nouns unless they're meaningful
-            if len(noun) == 1 and not self.is_hanja_char(noun):
-                continue
-            noun_freq[noun] = noun_freq.get(noun, 0) + 1
+        # Count frequency, skipping single character nouns unless they're meaningful
+        noun_freq = Counter(
+            noun for noun in nouns
+            if len(noun) > 1 or self.is_hanja_char(noun)
+        )
         
-        # Calculate TF scores
+        # Return the most frequent keywords with their TF scores
         total_nouns = len(nouns)
-        tf_scores = {noun: freq / total_nouns for noun, freq in noun_freq.items()}
-        
-        # Sort by frequency and return top keywords
-        sorted_keywords = sorted(tf_scores.items(), key=lambda x: x[1], reverse=True)
-        
-        return sorted_keywords[:num_keywords]
+        return [(noun, freq / total_nouns) for noun, freq in noun_freq.most_common(num_keywords)]
     
     def correct_spacing(self, text: str) -> str:
         """Correct spacing in Korean text using available NLP tools.
@@ -644,34 +846,6 @@ class KoreanTextProcessor(LoggingMixin):
             'polite_particles': 0
         }
         
-        # Formal endings
-        formal_patterns = [
-            r'습니다$',  # 습니다
-            r'입니다$',  # 입니다
-            r'습니까$',  # 습니까
-            r'입니까$',  # 입니까
-            r'세요$',    # 세요
-            r'어요$',    # 어요
-            r'아요$',    # 아요
-            r'십니까$',  # 십니까
-            r'십니다$'   # 십니다
-        ]
-        
-        # Informal endings
-        informal_patterns = [
-            r'다$',      # 다 (but not 니다)
-            r'냐$',      # 냐
-            r'어$',      # 어
-            r'아$',      # 아
-            r'지$',      # 지
-            r'야$',      # 야
-            r'네$',      # 네
-            r'군$',      # 군
-            r'구나$',    # 구나
-            r'자$',      # 자
-            r'라$'       # 라
-        ]
-        
         # Honorific words
         honorific_words = [
             '님',        # 님
@@ -692,23 +866,11 @@ class KoreanTextProcessor(LoggingMixin):
             sentence_clean = sentence.rstrip('.!?。！？…')
             
             # Check formal endings
-            for pattern in formal_patterns:
-                if re.search(pattern, sentence_clean):
-                    analysis['formal_endings'] += 1
-                    break
-            
+            if _FORMAL_ENDING_RE.search(sentence_clean):
+                analysis['formal_endings'] += 1
             # Check informal endings - but exclude formal endings that contain 다
-            is_formal = False
-            for pattern in formal_patterns:
-                if re.search(pattern, sentence_clean):
-                    is_formal = True
-                    break
-            
-            if not is_formal:
-                for pattern in informal_patterns:
-                    if re.search(pattern, sentence_clean):
-                        analysis['informal_endings'] += 1
-                        break
+            elif _INFORMAL_ENDING_RE.search(sentence_clean):
+                analysis['informal_endings'] += 1
             
             # Count honorifics
             for honorific in honorific_words:
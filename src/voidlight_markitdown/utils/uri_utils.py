@@ -49,6 +49,12 @@ def parse_data_uri(uri: str) -> Tuple[Optional[str], Dict[str, str], bytes]:
         elif len(part) > 0:
             attributes[part] = ""
 
-    content = base64.b64decode(data) if is_base64 else unquote_to_bytes(data)
+    if is_base64:
+        content = base64.b64decode(data)
+    elif "%" not in data:
+        # Nothing to unquote
+        content = data.encode("utf-8")
+    else:
+        content = unquote_to_bytes(data)
 
     return mime_type, attributes, content
\ No newline at end of file
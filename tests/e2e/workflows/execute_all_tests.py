@@ -9,9 +9,24 @@ import json
 import os
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Each test file runs in its own interpreter, so threads are enough to
+# keep several of them going at once.
+MAX_WORKERS = os.cpu_count() or 1
+
+# Only self-contained categories run concurrently; the integration and MCP
+# tests start servers on fixed ports (e.g. 3001) and would collide.
+PARALLEL_CATEGORIES = {'unit_tests', 'korean_nlp_tests'}
+
 # Define all test files by category
 TEST_CATEGORIES = {
     'unit_tests': [
@@ -70,21 +85,19 @@ TEST_CATEGORIES = {
 
 def run_pytest_file(test_file):
     """Run a pytest file and return results"""
-    print(f"\n{'='*70}")
-    print(f"Running: {test_file}")
-    print(f"{'='*70}")
-    
     result = {
         'file': test_file,
         'start_time': datetime.now().isoformat(),
     }
+    # Files run concurrently, so each needs its own report file
+    report_file = f"test_report_{test_file.replace('/', '_')}.json"
     
     try:
         cmd = [
             sys.executable, '-m', 'pytest',
             test_file,
             '-v', '--tb=short',
-            '--json-report', '--json-report-file=test_report.json'
+            '--json-report', f'--json-report-file={report_file}'
         ]
         
         start = time.time()
@@ -103,11 +116,11 @@ def run_pytest_file(test_file):
         
         # Try to parse pytest json report
         try:
-            with open('test_report.json', 'r') as f:
+            with open(report_file, 'r') as f:
                 pytest_report = json.load(f)
                 result['summary'] = pytest_report.get('summary', {})
                 result['tests'] = len(pytest_report.get('tests', []))
-            os.remove('test_report.json')
+            os.remove(report_file)
         except:
             # Fallback to parsing stdout
             if 'passed' in proc.stdout or 'failed' in proc.stdout:
@@ -139,10 +152,6 @@ def run_pytest_file(test_file):
 
 def run_python_script(test_file):
     """Run a regular Python script test file"""
-    print(f"\n{'='*70}")
-    print(f"Running Python script: {test_file}")
-    print(f"{'='*70}")
-    
     result = {
         'file': test_file,
         'start_time': datetime.now().isoformat(),
@@ -184,14 +193,54 @@ def run_python_script(test_file):
     return result
 
 def is_pytest_file(file_path):
-    """Check if file uses pytest"""
-    if not Path(file_path).exists():
-        return False
-    
+    """Check if file uses pytest (callers only pass files that exist)"""
     with open(file_path, 'r') as f:
         content = f.read()
         return 'import pytest' in content or 'from pytest' in content or 'def test_' in content
 
+def run_test_file(test_file, announce=True):
+    """Determine test type and run; concurrent runs pass announce=False"""
+    pytest_file = is_pytest_file(test_file)
+    if announce:
+        print(f"\n{'='*70}")
+        print(f"Running{'' if pytest_file else ' Python script'}: {test_file}")
+        print(f"{'='*70}")
+    
+    if pytest_file:
+        return run_pytest_file(test_file)
+    return run_python_script(test_file)
+
+def print_result(test_file, result):
+    """Print a one-line status for a finished test file"""
+    if result['status'] == 'passed':
+        print(f"✅ PASSED: {test_file}")
+    elif result['status'] == 'failed':
+        print(f"❌ FAILED: {test_file}")
+    elif result['status'] == 'timeout':
+        print(f"⏱️  TIMEOUT: {test_file}")
+    else:
+        print(f"⚠️  ERROR: {test_file}")
+
+def summarize_results(results):
+    """Count results by status in a single pass"""
+    counts = Counter(r['status'] for r in results)
+    return {
+        'total': len(results),
+        'passed': counts['passed'],
+        'failed': counts['failed'],
+        'timeout': counts['timeout'],
+        'error': counts['error'],
+    }
+
+def save_report(report, path):
+    """Write the report as indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+
 def main():
     print(f"Starting comprehensive test execution at {datetime.now()}")
     print(f"Working directory: {os.getcwd()}")
@@ -209,39 +258,36 @@ def main():
         
         category_results = []
         
+        existing_files = []
         for test_file in test_files:
             if not Path(test_file).exists():
                 print(f"⚠️  Test file not found: {test_file}")
                 continue
-                
-            # Determine test type and run
-            if is_pytest_file(test_file):
-                result = run_pytest_file(test_file)
-            else:
-                result = run_python_script(test_file)
-                
+            existing_files.append(test_file)
+        
+        def record(test_file, result):
             result['category'] = category
             category_results.append(result)
             all_results.append(result)
             
             # Print quick summary
-            if result['status'] == 'passed':
-                print(f"✅ PASSED: {test_file}")
-            elif result['status'] == 'failed':
-                print(f"❌ FAILED: {test_file}")
-            elif result['status'] == 'timeout':
-                print(f"⏱️  TIMEOUT: {test_file}")
-            else:
-                print(f"⚠️  ERROR: {test_file}")
+            print_result(test_file, result)
+        
+        if category in PARALLEL_CATEGORIES and len(existing_files) > 1:
+            # Output is captured per file, so only the status lines are printed, as each file finishes
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(existing_files))) as executor:
+                futures = {
+                    executor.submit(run_test_file, test_file, False): test_file
+                    for test_file in existing_files
+                }
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+        else:
+            for test_file in existing_files:
+                record(test_file, run_test_file(test_file))
                 
         # Category summary
-        category_summaries[category] = {
-            'total': len(category_results),
-            'passed': len([r for r in category_results if r['status'] == 'passed']),
-            'failed': len([r for r in category_results if r['status'] == 'failed']),
-            'timeout': len([r for r in category_results if r['status'] == 'timeout']),
-            'error': len([r for r in category_results if r['status'] == 'error']),
-        }
+        category_summaries[category] = summarize_results(category_results)
     
     # Generate final report
     report = {
@@ -250,18 +296,11 @@ def main():
         'total_files': len(all_results),
         'category_summaries': category_summaries,
         'results': all_results,
-        'overall_summary': {
-            'total': len(all_results),
-            'passed': len([r for r in all_results if r['status'] == 'passed']),
-            'failed': len([r for r in all_results if r['status'] == 'failed']),
-            'timeout': len([r for r in all_results if r['status'] == 'timeout']),
-            'error': len([r for r in all_results if r['status'] == 'error']),
-        }
+        'overall_summary': summarize_results(all_results),
     }
     
     # Save detailed report
-    with open('comprehensive_test_report.json', 'w') as f:
-        json.dump(report, f, indent=2)
+    save_report(report, 'comprehensive_test_report.json')
         
     # Print summary
     print(f"\n{'='*70}")
@@ -174,14 +174,15 @@ class IntegrationTestRunner:
     def generate_summary(self) -> dict:
         """Generate test execution summary"""
         total_duration = (datetime.now() - self.start_time).total_seconds()
+        passed = sum(1 for r in self.results.values() if r['passed'])
         
         summary = {
             "start_time": self.start_time.isoformat(),
             "end_time": datetime.now().isoformat(),
             "total_duration_seconds": total_duration,
             "test_suites_run": len(self.results),
-            "passed": sum(1 for r in self.results.values() if r['passed']),
-            "failed": sum(1 for r in self.results.values() if not r['passed']),
+            "passed": passed,
+            "failed": len(self.results) - passed,
             "results": self.results
         }
         
@@ -8,6 +8,7 @@ import os
 import sys
 import time
 import json
+import shutil
 import psutil
 import threading
 from pathlib import Path
@@ -15,6 +16,11 @@ from typing import Dict, Any, List, Tuple
 import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -24,6 +30,30 @@ except ImportError as e:
     print(f"Failed to import voidlight_markitdown: {e}")
     sys.exit(1)
 
+# File size scaling durations in seconds, unless AUDIO_PERF_DURATIONS is set
+DEFAULT_DURATIONS = [1, 5, 10, 30, 60, 120, 300]
+
+
+def parse_durations(value: str) -> List[int]:
+    """Parse a comma-separated list of durations, skipping empty entries.
+    
+    Falls back to DEFAULT_DURATIONS when no entries are given.
+    """
+    parts = [part.strip() for part in value.split(",")]
+    parts = [part for part in parts if part]
+    if not parts:
+        return list(DEFAULT_DURATIONS)
+    
+    try:
+        durations = [int(part) for part in parts]
+    except ValueError:
+        durations = []
+    if not durations or min(durations) <= 0:
+        raise ValueError(
+            f"AUDIO_PERF_DURATIONS must be positive whole seconds separated by commas, got {value!r}"
+        )
+    return durations
+
 
 class AudioPerformanceBenchmark:
     """Benchmark audio conversion performance."""
@@ -33,6 +63,10 @@ class AudioPerformanceBenchmark:
         self.results_dir = Path(__file__).parent / "benchmark_results"
         self.results_dir.mkdir(exist_ok=True)
         
+        # Generated audio, keyed by (duration, format, sample_rate), shared
+        # across benchmarks and removed by cleanup_test_files()
+        self._test_files: Dict[Tuple[int, str, int], str] = {}
+        
         self.benchmark_results = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "system_info": self._get_system_info(),
@@ -72,8 +106,9 @@ class AudioPerformanceBenchmark:
         """Benchmark how performance scales with file size."""
         print("\n=== File Size Scaling Benchmark ===")
         
-        # Test different file sizes (durations in seconds)
-        durations = [1, 5, 10, 30, 60, 120, 300]
+        # Test different file sizes (durations in seconds). Set
+        # AUDIO_PERF_DURATIONS (e.g. "1,5") to run a shorter set.
+        durations = parse_durations(os.environ.get("AUDIO_PERF_DURATIONS", ""))
         results = []
         
         for duration in durations:
@@ -92,16 +127,16 @@ class AudioPerformanceBenchmark:
             
             # Measure conversion time
             monitor_thread.start()
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             try:
                 result = self.markitdown.convert(test_file)
-                end_time = time.time()
+                end_time = time.perf_counter()
                 processing_time = end_time - start_time
                 success = True
                 error = None
             except Exception as e:
-                end_time = time.time()
+                end_time = time.perf_counter()
                 processing_time = end_time - start_time
                 success = False
                 error = str(e)
@@ -135,9 +170,6 @@ class AudioPerformanceBenchmark:
             print(f"  Realtime factor: {result_data['realtime_factor']:.2f}x")
             print(f"  CPU usage: {resources['avg_cpu']:.1f}% avg, {resources['max_cpu']:.1f}% max")
             print(f"  Memory usage: {resources['avg_memory']:.1f}% avg, {resources['max_memory']:.1f}% max")
-            
-            # Cleanup
-            os.remove(test_file)
         
         self.benchmark_results["benchmarks"]["file_size_scaling"] = results
         return results
@@ -165,10 +197,10 @@ class AudioPerformanceBenchmark:
             # Measure conversion time (average of 3 runs)
             times = []
             for i in range(3):
-                start_time = time.time()
+                start_time = time.perf_counter()
                 try:
                     result = self.markitdown.convert(test_file)
-                    end_time = time.time()
+                    end_time = time.perf_counter()
                     times.append(end_time - start_time)
                 except Exception as e:
                     print(f"  Error: {e}")
@@ -192,9 +224,6 @@ class AudioPerformanceBenchmark:
                 print(f"  File size: {file_size:.2f} MB")
                 print(f"  Avg processing time: {avg_time:.2f}s ± {std_time:.3f}s")
                 print(f"  Speed: {result_data['speed_mb_per_sec']:.2f} MB/s")
-            
-            # Cleanup
-            os.remove(test_file)
         
         self.benchmark_results["benchmarks"]["format_performance"] = results
         return results
@@ -214,10 +243,10 @@ class AudioPerformanceBenchmark:
             test_file = self._create_test_file(duration, sample_rate=rate)
             file_size = os.path.getsize(test_file) / (1024 * 1024)  # MB
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = self.markitdown.convert(test_file)
-                end_time = time.time()
+                end_time = time.perf_counter()
                 processing_time = end_time - start_time
                 
                 # Check if transcript was generated
@@ -249,9 +278,6 @@ class AudioPerformanceBenchmark:
                 print(f"  Transcript generated: {result_data['has_transcript']}")
             else:
                 print(f"  Failed: {result_data.get('error')}")
-            
-            # Cleanup
-            os.remove(test_file)
         
         self.benchmark_results["benchmarks"]["sample_rate_impact"] = results
         return results
@@ -276,7 +302,7 @@ class AudioPerformanceBenchmark:
                 test_files.append(test_file)
             
             # Process concurrently
-            start_time = time.time()
+            start_time = time.perf_counter()
             
             with concurrent.futures.ThreadPoolExecutor(max_workers=num_concurrent) as executor:
                 futures = [executor.submit(self.markitdown.convert, f) for f in test_files]
@@ -289,7 +315,7 @@ class AudioPerformanceBenchmark:
                     except Exception as e:
                         print(f"    Concurrent error: {e}")
             
-            end_time = time.time()
+            end_time = time.perf_counter()
             total_time = end_time - start_time
             
             # Calculate throughput
@@ -312,20 +338,19 @@ class AudioPerformanceBenchmark:
             print(f"  Avg time per file: {result_data['avg_time_per_file']:.2f}s")
             print(f"  Throughput: {throughput:.2f} MB/s")
             print(f"  Success rate: {success_count}/{num_concurrent}")
-            
-            # Cleanup
-            for f in test_files:
-                os.remove(f)
         
         self.benchmark_results["benchmarks"]["concurrent_load"] = results
         return results
     
     def _create_test_file(self, duration: int, format: str = "wav", 
                          sample_rate: int = 44100) -> str:
-        """Create a test audio file."""
+        """Create a test audio file, reusing one already generated."""
         import wave
-        import struct
-        import math
+        
+        key = (duration, format, sample_rate)
+        cached = self._test_files.get(key)
+        if cached and os.path.exists(cached):
+            return cached
         
         filename = f"test_{duration}s_{sample_rate}hz.{format}"
         filepath = self.results_dir / filename
@@ -339,35 +364,36 @@ class AudioPerformanceBenchmark:
                 
                 # Generate a simple tone with varying frequency
                 num_frames = sample_rate * duration
-                frames = []
-                
-                for i in range(num_frames):
-                    t = i / sample_rate
-                    # Varying frequency from 440Hz to 880Hz
-                    frequency = 440 + 440 * (i / num_frames)
-                    value = int(32767 * 0.5 * math.sin(2 * math.pi * frequency * t))
-                    frames.append(value)
-                
-                data = struct.pack('<' + 'h' * num_frames, *frames)
-                wav_file.writeframes(data)
+                i = np.arange(num_frames)
+                t = i / sample_rate
+                # Varying frequency from 440Hz to 880Hz
+                frequency = 440 + 440 * (i / num_frames)
+                frames = (32767 * 0.5 * np.sin(2 * np.pi * frequency * t)).astype('<i2')
+                wav_file.writeframes(frames.tobytes())
         
         else:
             # For other formats, create WAV first then convert
-            wav_file = str(filepath).replace(f".{format}", ".wav")
-            self._create_test_file(duration, "wav", sample_rate)
+            wav_file = self._create_test_file(duration, "wav", sample_rate)
             
             # Use ffmpeg to convert if available
             try:
                 import subprocess
                 cmd = ["ffmpeg", "-i", wav_file, "-y", str(filepath)]
                 subprocess.run(cmd, capture_output=True, check=True)
-                os.remove(wav_file)
             except:
-                # If conversion fails, just rename to WAV
-                os.rename(wav_file, str(filepath))
+                # If conversion fails, just copy the WAV
+                shutil.copyfile(wav_file, str(filepath))
         
+        self._test_files[key] = str(filepath)
         return str(filepath)
     
+    def cleanup_test_files(self):
+        """Remove all generated test audio files."""
+        for test_file in self._test_files.values():
+            if os.path.exists(test_file):
+                os.remove(test_file)
+        self._test_files.clear()
+    
     def generate_visualizations(self):
         """Generate performance visualization plots."""
         print("\n=== Generating Visualizations ===")
@@ -452,8 +478,16 @@ class AudioPerformanceBenchmark:
     def save_results(self):
         """Save benchmark results to file."""
         results_file = self.results_dir / "benchmark_results.json"
-        with open(results_file, 'w') as f:
-            json.dump(self.benchmark_results, f, indent=2)
+        if orjson is not None:
+            # Resource averages are NumPy scalars, which orjson needs told about
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    self.benchmark_results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                ))
+        else:
+            with open(results_file, 'w') as f:
+                json.dump(self.benchmark_results, f, indent=2)
         
         # Generate summary report
         self._generate_summary_report()
@@ -462,57 +496,60 @@ class AudioPerformanceBenchmark:
         """Generate a markdown summary report."""
         report_file = self.results_dir / "benchmark_report.md"
         
+        parts = []
+        parts.append("# Audio Converter Performance Benchmark Report\n\n")
+        parts.append(f"**Date:** {self.benchmark_results['timestamp']}\n\n")
+        
+        # System info
+        parts.append("## System Information\n\n")
+        info = self.benchmark_results['system_info']
+        parts.append(f"- Platform: {info['platform']}\n")
+        parts.append(f"- CPU Cores: {info['cpu_count']}\n")
+        parts.append(f"- Total Memory: {info['total_memory_gb']:.1f} GB\n")
+        parts.append(f"- Python Version: {info['python_version'].split()[0]}\n\n")
+        
+        # File size scaling
+        if "file_size_scaling" in self.benchmark_results["benchmarks"]:
+            parts.append("## File Size Scaling\n\n")
+            parts.append("| Duration | File Size | Processing Time | Speed | Realtime Factor |\n")
+            parts.append("|----------|-----------|-----------------|-------|------------------|\n")
+            
+            for data in self.benchmark_results["benchmarks"]["file_size_scaling"]:
+                if data["success"]:
+                    parts.append(f"| {data['duration_seconds']}s | "
+                                f"{data['file_size_mb']:.1f} MB | "
+                                f"{data['processing_time']:.2f}s | "
+                                f"{data['speed_mb_per_sec']:.2f} MB/s | "
+                                f"{data['realtime_factor']:.2f}x |\n")
+            parts.append("\n")
+        
+        # Format performance
+        if "format_performance" in self.benchmark_results["benchmarks"]:
+            parts.append("## Format Performance\n\n")
+            parts.append("| Format | File Size | Avg Time | Speed |\n")
+            parts.append("|--------|-----------|----------|--------|\n")
+            
+            for data in self.benchmark_results["benchmarks"]["format_performance"]:
+                parts.append(f"| {data['format'].upper()} | "
+                            f"{data['file_size_mb']:.1f} MB | "
+                            f"{data['avg_processing_time']:.2f}s | "
+                            f"{data['speed_mb_per_sec']:.2f} MB/s |\n")
+            parts.append("\n")
+        
+        # Concurrent load
+        if "concurrent_load" in self.benchmark_results["benchmarks"]:
+            parts.append("## Concurrent Processing\n\n")
+            parts.append("| Concurrent Files | Total Time | Avg/File | Throughput |\n")
+            parts.append("|------------------|------------|----------|-------------|\n")
+            
+            for data in self.benchmark_results["benchmarks"]["concurrent_load"]:
+                parts.append(f"| {data['concurrent_count']} | "
+                            f"{data['total_time']:.2f}s | "
+                            f"{data['avg_time_per_file']:.2f}s | "
+                            f"{data['throughput_mb_per_sec']:.2f} MB/s |\n")
+        
         with open(report_file, 'w') as f:
-            f.write("# Audio Converter Performance Benchmark Report\n\n")
-            f.write(f"**Date:** {self.benchmark_results['timestamp']}\n\n")
-            
-            # System info
-            f.write("## System Information\n\n")
-            info = self.benchmark_results['system_info']
-            f.write(f"- Platform: {info['platform']}\n")
-            f.write(f"- CPU Cores: {info['cpu_count']}\n")
-            f.write(f"- Total Memory: {info['total_memory_gb']:.1f} GB\n")
-            f.write(f"- Python Version: {info['python_version'].split()[0]}\n\n")
-            
-            # File size scaling
-            if "file_size_scaling" in self.benchmark_results["benchmarks"]:
-                f.write("## File Size Scaling\n\n")
-                f.write("| Duration | File Size | Processing Time | Speed | Realtime Factor |\n")
-                f.write("|----------|-----------|-----------------|-------|------------------|\n")
-                
-                for data in self.benchmark_results["benchmarks"]["file_size_scaling"]:
-                    if data["success"]:
-                        f.write(f"| {data['duration_seconds']}s | "
-                               f"{data['file_size_mb']:.1f} MB | "
-                               f"{data['processing_time']:.2f}s | "
-                               f"{data['speed_mb_per_sec']:.2f} MB/s | "
-                               f"{data['realtime_factor']:.2f}x |\n")
-                f.write("\n")
-            
-            # Format performance
-            if "format_performance" in self.benchmark_results["benchmarks"]:
-                f.write("## Format Performance\n\n")
-                f.write("| Format | File Size | Avg Time | Speed |\n")
-                f.write("|--------|-----------|----------|--------|\n")
-                
-                for data in self.benchmark_results["benchmarks"]["format_performance"]:
-                    f.write(f"| {data['format'].upper()} | "
-                           f"{data['file_size_mb']:.1f} MB | "
-                           f"{data['avg_processing_time']:.2f}s | "
-                           f"{data['speed_mb_per_sec']:.2f} MB/s |\n")
-                f.write("\n")
-            
-            # Concurrent load
-            if "concurrent_load" in self.benchmark_results["benchmarks"]:
-                f.write("## Concurrent Processing\n\n")
-                f.write("| Concurrent Files | Total Time | Avg/File | Throughput |\n")
-                f.write("|------------------|------------|----------|-------------|\n")
-                
-                for data in self.benchmark_results["benchmarks"]["concurrent_load"]:
-                    f.write(f"| {data['concurrent_count']} | "
-                           f"{data['total_time']:.2f}s | "
-                           f"{data['avg_time_per_file']:.2f}s | "
-                           f"{data['throughput_mb_per_sec']:.2f} MB/s |\n")
+            f.write("".join(parts))
         
         print(f"Benchmark report saved to: {report_file}")
 
@@ -529,6 +566,7 @@ def main():
     benchmark.benchmark_format_performance()
     benchmark.benchmark_sample_rate_impact()
     benchmark.benchmark_concurrent_load()
+    benchmark.cleanup_test_files()
     
     # Generate visualizations
     try:
@@ -4,13 +4,17 @@ Main Audio Test Runner
 Runs all audio converter tests and generates comprehensive reports.
 """
 
+import argparse
+import importlib.util
 import os
+import shutil
 import sys
 import subprocess
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 def run_command(cmd: List[str], description: str) -> Dict[str, Any]:
     """Run a command and capture output."""
@@ -19,50 +23,65 @@ def run_command(cmd: List[str], description: str) -> Dict[str, Any]:
     print(f"Command: {' '.join(cmd)}")
     print(f"{'='*60}")
     
-    start_time = time.time()
+    start_time = time.perf_counter()
     
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        print(f"✓ Completed in {duration:.2f} seconds")
+    # Stream the child's output line by line instead of buffering all of it
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    )
+    for line in process.stdout:
+        print(f"[{description}] {line}", end="")
+    returncode = process.wait()
+    
+    end_time = time.perf_counter()
+    duration = end_time - start_time
+    
+    if returncode == 0:
+        print(f"✓ {description} completed in {duration:.2f} seconds")
         
         return {
             "success": True,
-            "duration": duration,
-            "stdout": result.stdout,
-            "stderr": result.stderr
-        }
-        
-    except subprocess.CalledProcessError as e:
-        end_time = time.time()
-        duration = end_time - start_time
-        
-        print(f"✗ Failed after {duration:.2f} seconds")
-        print(f"Error: {e}")
-        if e.stdout:
-            print(f"STDOUT:\n{e.stdout}")
-        if e.stderr:
-            print(f"STDERR:\n{e.stderr}")
-        
-        return {
-            "success": False,
-            "duration": duration,
-            "error": str(e),
-            "stdout": e.stdout,
-            "stderr": e.stderr
+            "duration": duration
         }
+    
+    error = subprocess.CalledProcessError(returncode, cmd)
+    print(f"✗ {description} failed after {duration:.2f} seconds")
+    print(f"Error: {error}")
+    
+    return {
+        "success": False,
+        "duration": duration,
+        "error": str(error)
+    }
+
+
+def run_test_script(test_dir: Path, test_info: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a single test script, returning None if it does not exist."""
+    script_path = test_dir / test_info["script"]
+    
+    if not script_path.exists():
+        print(f"\nWarning: {test_info['script']} not found")
+        return None
+    
+    cmd = [sys.executable, str(script_path)]
+    return run_command(cmd, test_info["description"])
+
 
+def is_interactive() -> bool:
+    """Whether the runner may prompt; never in CI or without a terminal."""
+    return sys.stdin.isatty() and not os.environ.get("CI")
 
-def check_dependencies():
-    """Check and install required dependencies."""
+
+def check_dependencies(install: Optional[bool] = None):
+    """Check and install required dependencies.
+    
+    ``install`` forces the install decision; when None the user is asked,
+    or installation is skipped if the runner is not interactive.
+    """
     print("\n=== Checking Dependencies ===")
     
     dependencies = {
@@ -76,19 +95,18 @@ def check_dependencies():
     
     missing = []
     
+    # find_spec checks availability without running the modules' import code
     for module, package in dependencies.items():
-        try:
-            __import__(module)
+        if importlib.util.find_spec(module) is not None:
             print(f"✓ {module}")
-        except ImportError:
+        else:
             print(f"✗ {module} - Missing")
             missing.append(package)
     
     # Check for ffmpeg
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
+    if shutil.which('ffmpeg') is not None:
         print("✓ ffmpeg")
-    except:
+    else:
         print("✗ ffmpeg - Missing (required for format conversion)")
         print("  Install: brew install ffmpeg (macOS) or apt install ffmpeg (Linux)")
     
@@ -96,8 +114,9 @@ def check_dependencies():
         print(f"\nInstall missing dependencies with:")
         print(f"  pip install {' '.join(missing)}")
         
-        response = input("\nInstall now? (y/N): ")
-        if response.lower() == 'y':
+        if install is None:
+            install = is_interactive() and input("\nInstall now? (y/N): ").lower() == 'y'
+        if install:
             cmd = [sys.executable, "-m", "pip", "install"] + missing
             subprocess.run(cmd)
     
@@ -106,6 +125,14 @@ def check_dependencies():
 
 def main():
     """Main test runner."""
+    parser = argparse.ArgumentParser(description="Run all audio converter tests")
+    install_group = parser.add_mutually_exclusive_group()
+    install_group.add_argument("--yes", action="store_true",
+                               help="Install missing dependencies and continue without prompting")
+    install_group.add_argument("--no-install", action="store_true",
+                               help="Never install dependencies; continue without prompting")
+    args = parser.parse_args()
+    
     print("Audio Converter Test Suite")
     print("=" * 80)
     print("This will run comprehensive tests for audio conversion capabilities")
@@ -113,11 +140,13 @@ def main():
     print("=" * 80)
     
     # Check dependencies
-    if not check_dependencies():
+    install = True if args.yes else False if args.no_install else None
+    if not check_dependencies(install):
         print("\nSome dependencies are missing. Tests may be limited.")
-        response = input("Continue anyway? (y/N): ")
-        if response.lower() != 'y':
-            return 1
+        if install is None and is_interactive():
+            response = input("Continue anyway? (y/N): ")
+            if response.lower() != 'y':
+                return 1
     
     # Test scripts to run
     test_dir = Path(__file__).parent
@@ -135,7 +164,9 @@ def main():
         {
             "script": "benchmark_audio_performance.py",
             "description": "Performance benchmarking",
-            "required": False
+            "required": False,
+            # Timings and resource samples are only meaningful with nothing else running
+            "exclusive": True
         },
         {
             "script": "test_korean_audio_recognition.py",
@@ -149,29 +180,56 @@ def main():
         "tests": {}
     }
     
-    # Run each test script
-    for test_info in test_scripts:
-        script_path = test_dir / test_info["script"]
-        
-        if not script_path.exists():
-            print(f"\nWarning: {test_info['script']} not found")
-            continue
-        
-        cmd = [sys.executable, str(script_path)]
-        result = run_command(cmd, test_info["description"])
-        
+    def record(test_info: Dict[str, Any], result: Dict[str, Any]):
         results["tests"][test_info["script"]] = {
             "description": test_info["description"],
             "success": result["success"],
             "duration": result["duration"],
             "required": test_info["required"]
         }
+    
+    # Required scripts run in order, since later ones use their output
+    required_passed = True
+    for test_info in test_scripts:
+        if not test_info["required"]:
+            continue
+        
+        result = run_test_script(test_dir, test_info)
+        if result is None:
+            continue
+        
+        record(test_info, result)
         
-        if not result["success"] and test_info["required"]:
+        if not result["success"]:
             print(f"\nCritical test failed: {test_info['script']}")
             print("Stopping test suite.")
+            required_passed = False
             break
     
+    # The remaining scripts are independent of each other. When more than one
+    # non-exclusive script can run alongside another, leaving two cores of
+    # headroom, those run concurrently first; everything else runs alone.
+    if required_passed:
+        optional_scripts = [t for t in test_scripts if not t["required"]]
+        concurrent_scripts = [t for t in optional_scripts if not t.get("exclusive")]
+        max_workers = min(len(concurrent_scripts), (os.cpu_count() or 1) - 2)
+        concurrent_results = {}
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                concurrent_results = dict(zip(
+                    (test_info["script"] for test_info in concurrent_scripts),
+                    executor.map(lambda test_info: run_test_script(test_dir, test_info), concurrent_scripts)
+                ))
+        
+        # Results are recorded in script order, however the scripts were run
+        for test_info in optional_scripts:
+            if test_info["script"] in concurrent_results:
+                result = concurrent_results[test_info["script"]]
+            else:
+                result = run_test_script(test_dir, test_info)
+            if result is not None:
+                record(test_info, result)
+    
     # Generate summary report
     print("\n" + "=" * 80)
     print("TEST SUITE SUMMARY")
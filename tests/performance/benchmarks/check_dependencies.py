@@ -4,32 +4,28 @@ Check if all dependencies for performance testing are available.
 """
 
 import sys
-import importlib
-import subprocess
+import importlib.util
+import shutil
 from pathlib import Path
 
 def check_import(module_name: str, package_name: str = None) -> bool:
-    """Check if a module can be imported."""
+    """Check if a module is installed, without importing it."""
     if package_name is None:
         package_name = module_name
     
-    try:
-        importlib.import_module(module_name)
-        print(f"✅ {package_name}")
-        return True
-    except ImportError:
+    if importlib.util.find_spec(module_name) is None:
         print(f"❌ {package_name} - Install with: pip install {package_name}")
         return False
+    print(f"✅ {package_name}")
+    return True
 
 def check_command(command: str) -> bool:
     """Check if a command is available."""
-    try:
-        subprocess.run([command, "--version"], capture_output=True, check=False)
-        print(f"✅ {command}")
-        return True
-    except FileNotFoundError:
+    if shutil.which(command) is None:
         print(f"❌ {command} - Not found in PATH")
         return False
+    print(f"✅ {command}")
+    return True
 
 def main():
     """Check all dependencies."""
@@ -11,6 +11,7 @@ import random
 import string
 import json
 import struct
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -29,6 +30,13 @@ from reportlab.lib.colors import HexColor
 import pandas as pd
 import numpy as np
 
+# Worker processes for the smaller files; override with TEST_FILE_WORKERS
+DEFAULT_WORKERS = 4
+
+# Files of at least this many MB are built one at a time, since each one is
+# held in memory (hundreds of MB for DOCX and PDF) until it is saved
+SERIAL_SIZE_MB = 100
+
 class TestFileGenerator:
     """Generate various types of test files for performance testing."""
     
@@ -498,8 +506,13 @@ class TestFileGenerator:
         print(f"  Generated: {filename} ({actual_size_mb:.2f}MB, {sheet_num} sheets)")
         return str(filepath)
     
-    def generate_all_test_files(self) -> Dict[str, List[str]]:
-        """Generate all test files for benchmarking."""
+    def generate_all_test_files(self, max_workers: Optional[int] = None) -> Dict[str, List[str]]:
+        """Generate all test files for benchmarking.
+        
+        Files below SERIAL_SIZE_MB are generated in up to ``max_workers``
+        processes (default: TEST_FILE_WORKERS or DEFAULT_WORKERS); larger
+        ones follow one at a time to bound peak memory.
+        """
         print("Generating comprehensive test file suite...")
         print("=" * 60)
         
@@ -514,33 +527,41 @@ class TestFileGenerator:
         sizes = [10, 50, 100, 500]
         languages = ['english', 'korean', 'mixed']
         
-        # Generate text files
-        print("\n1. Generating text files...")
+        # Every file is independent, so the smaller ones are generated in parallel processes
+        tasks = []
         for size in sizes:
             for lang in languages:
-                filepath = self.generate_text_file(size, lang)
-                results['text'].append(filepath)
-        
-        # Generate PDF files
-        print("\n2. Generating PDF files...")
+                tasks.append(('text', self.generate_text_file, (size, lang)))
         for size in sizes[:3]:  # Skip 500MB for PDFs
             for lang in languages:
-                filepath = self.generate_pdf_file(size, include_images=True, language=lang)
-                results['pdf'].append(filepath)
-        
-        # Generate DOCX files
-        print("\n3. Generating DOCX files...")
+                tasks.append(('pdf', self.generate_pdf_file, (size, True, lang)))
         for size in sizes[:3]:  # Skip 500MB for DOCX
             for lang in languages:
-                filepath = self.generate_docx_file(size, lang)
-                results['docx'].append(filepath)
-        
-        # Generate Excel files
-        print("\n4. Generating Excel files...")
+                tasks.append(('docx', self.generate_docx_file, (size, lang)))
         for size in [10, 50]:  # Only smaller sizes for Excel
             for lang in languages:
-                filepath = self.generate_excel_file(size, lang)
-                results['excel'].append(filepath)
+                tasks.append(('excel', self.generate_excel_file, (size, lang)))
+        
+        if max_workers is None:
+            max_workers = int(os.environ.get("TEST_FILE_WORKERS", DEFAULT_WORKERS))
+        max_workers = max(1, min(max_workers, os.cpu_count() or 1))
+        
+        small_tasks = [task for task in tasks if task[2][0] < SERIAL_SIZE_MB]
+        large_tasks = [task for task in tasks if task[2][0] >= SERIAL_SIZE_MB]
+        
+        print(f"\nGenerating {len(small_tasks)} files on {max_workers} workers...")
+        # Reseed each worker so forked processes don't share one random sequence
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=random.seed) as executor:
+            futures = [
+                (file_type, executor.submit(generate, *args))
+                for file_type, generate, args in small_tasks
+            ]
+            for file_type, future in futures:
+                results[file_type].append(future.result())
+        
+        print(f"\nGenerating {len(large_tasks)} files of {SERIAL_SIZE_MB}MB or more one at a time...")
+        for file_type, generate, args in large_tasks:
+            results[file_type].append(generate(*args))
         
         # Save file manifest
         manifest_path = self.base_path / "test_files_manifest.json"
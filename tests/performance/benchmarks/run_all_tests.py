@@ -57,6 +57,9 @@ class PerformanceTestSuite:
             },
             'stages': {}
         }
+        
+        # Return values of stages run in this process, keyed by stage name
+        self.stage_outputs = {}
     
     def run_stage(self, stage_name: str, stage_func, *args, **kwargs):
         """Run a test stage and capture results."""
@@ -85,6 +88,7 @@ class PerformanceTestSuite:
         }
         
         if success:
+            self.stage_outputs[stage_name] = result
             print(f"\n✅ {stage_name} completed in {duration:.1f}s")
         
         return result
@@ -188,9 +192,21 @@ class PerformanceTestSuite:
         
         return {'skipped': True, 'reason': 'no_manifest'}
     
+    def load_stage_output(self, stage_name: str, output_dir: Path, pattern: str):
+        """Get a stage's results, reading its JSON file only if it did not run here."""
+        result = self.stage_outputs.get(stage_name)
+        if result:
+            return result
+        
+        for path in output_dir.glob(pattern):
+            with open(path, 'r') as f:
+                return json.load(f)
+        
+        return None
+    
     def generate_final_report(self):
         """Generate comprehensive final report."""
-        report = f"""# VoidLight MarkItDown Performance Test Report
+        parts = [f"""# VoidLight MarkItDown Performance Test Report
 
 Generated: {datetime.now().isoformat()}
 Test Directory: {self.run_dir}
@@ -204,94 +220,82 @@ This comprehensive performance test suite evaluated voidlight_markitdown across
 - Korean language processing
 - System stress limits
 
-"""
+"""]
         
         # Stage summaries
-        report += "## Test Stages\n\n"
-        report += "| Stage | Status | Duration |\n"
-        report += "|-------|--------|----------|\n"
+        parts.append("## Test Stages\n\n")
+        parts.append("| Stage | Status | Duration |\n")
+        parts.append("|-------|--------|----------|\n")
         
         for stage, info in self.results.get('stages', {}).items():
             status = "✅ Pass" if info['success'] else "❌ Fail"
             duration = f"{info['duration_seconds']:.1f}s"
-            report += f"| {stage.replace('_', ' ').title()} | {status} | {duration} |\n"
+            parts.append(f"| {stage.replace('_', ' ').title()} | {status} | {duration} |\n")
         
         # Key findings
-        report += "\n## Key Findings\n\n"
+        parts.append("\n## Key Findings\n\n")
         
         # Extract key metrics from benchmark results
-        benchmark_file = None
-        for f in self.benchmark_dir.glob("benchmark_report_*.json"):
-            benchmark_file = f
-            break
-        
-        if benchmark_file and benchmark_file.exists():
-            with open(benchmark_file, 'r') as f:
-                benchmark_data = json.load(f)
-            
+        benchmark_data = self.load_stage_output(
+            'run_benchmarks', self.benchmark_dir, "benchmark_report_*.json"
+        )
+        
+        if benchmark_data:
             if 'summary' in benchmark_data and 'overall' in benchmark_data['summary']:
                 overall = benchmark_data['summary']['overall']
-                report += f"- **Files Processed**: {overall.get('total_files', 0)}\n"
-                report += f"- **Total Size**: {overall.get('total_size_mb', 0):.1f}MB\n"
-                report += f"- **Average Throughput**: {overall.get('avg_throughput_mbps', 0):.1f}MB/s\n"
-                report += f"- **Average Memory**: {overall.get('avg_memory_peak_mb', 0):.1f}MB\n"
+                parts.append(f"- **Files Processed**: {overall.get('total_files', 0)}\n")
+                parts.append(f"- **Total Size**: {overall.get('total_size_mb', 0):.1f}MB\n")
+                parts.append(f"- **Average Throughput**: {overall.get('avg_throughput_mbps', 0):.1f}MB/s\n")
+                parts.append(f"- **Average Memory**: {overall.get('avg_memory_peak_mb', 0):.1f}MB\n")
         
         # Stress test results
-        stress_file = None
-        for f in self.stress_dir.glob("stress_test_results_*.json"):
-            stress_file = f
-            break
-        
-        if stress_file and stress_file.exists():
-            with open(stress_file, 'r') as f:
-                stress_data = json.load(f)
-            
+        stress_data = self.load_stage_output(
+            'run_stress_tests', self.stress_dir, "stress_test_results_*.json"
+        )
+        
+        if stress_data:
             if 'tests' in stress_data:
                 if 'maximum_file_size' in stress_data['tests']:
                     max_size = stress_data['tests']['maximum_file_size']
-                    report += f"\n### Limits\n"
-                    report += f"- **Maximum File Size**: {max_size.get('maximum_successful_mb', 'N/A')}MB\n"
+                    parts.append(f"\n### Limits\n")
+                    parts.append(f"- **Maximum File Size**: {max_size.get('maximum_successful_mb', 'N/A')}MB\n")
                 
                 if 'concurrent_operations' in stress_data['tests']:
                     concurrent = stress_data['tests']['concurrent_operations']
-                    report += f"- **Optimal Workers**: {concurrent.get('optimal_workers', 'N/A')}\n"
+                    parts.append(f"- **Optimal Workers**: {concurrent.get('optimal_workers', 'N/A')}\n")
         
         # Optimization validation
-        validation_file = None
-        for f in self.validation_dir.glob("validation_results_*.json"):
-            validation_file = f
-            break
-        
-        if validation_file and validation_file.exists():
-            with open(validation_file, 'r') as f:
-                validation_data = json.load(f)
-            
+        validation_data = self.load_stage_output(
+            'validate_optimizations', self.validation_dir, "validation_results_*.json"
+        )
+        
+        if validation_data:
             if 'summary' in validation_data:
                 summary = validation_data['summary']
-                report += f"\n### Optimization Validation\n"
-                report += f"- **Validations Passed**: {summary.get('passed', 0)}/{summary.get('total_validations', 0)}\n"
-                report += f"- **Success Rate**: {summary.get('success_rate', 0):.1f}%\n"
-        
-        report += "\n## Recommendations\n\n"
-        report += "1. **File Size**: System handles files up to 500MB efficiently\n"
-        report += "2. **Concurrency**: Use 2-3 workers for optimal throughput\n"
-        report += "3. **Memory**: Stream processing keeps memory usage low\n"
-        report += "4. **Korean Text**: Korean mode adds <10% overhead\n"
-        report += "5. **Monitoring**: Resource usage scales linearly with file size\n"
-        
-        report += f"\n## Test Artifacts\n\n"
-        report += f"All test results and artifacts are saved in:\n"
-        report += f"`{self.run_dir}`\n\n"
-        report += "- `test_files/` - Generated test files\n"
-        report += "- `benchmarks/` - Performance benchmark results\n"
-        report += "- `stress_tests/` - Stress test results\n"
-        report += "- `validations/` - Optimization validation results\n"
-        report += "- `monitoring/` - Resource monitoring data\n"
+                parts.append(f"\n### Optimization Validation\n")
+                parts.append(f"- **Validations Passed**: {summary.get('passed', 0)}/{summary.get('total_validations', 0)}\n")
+                parts.append(f"- **Success Rate**: {summary.get('success_rate', 0):.1f}%\n")
+        
+        parts.append("\n## Recommendations\n\n")
+        parts.append("1. **File Size**: System handles files up to 500MB efficiently\n")
+        parts.append("2. **Concurrency**: Use 2-3 workers for optimal throughput\n")
+        parts.append("3. **Memory**: Stream processing keeps memory usage low\n")
+        parts.append("4. **Korean Text**: Korean mode adds <10% overhead\n")
+        parts.append("5. **Monitoring**: Resource usage scales linearly with file size\n")
+        
+        parts.append(f"\n## Test Artifacts\n\n")
+        parts.append(f"All test results and artifacts are saved in:\n")
+        parts.append(f"`{self.run_dir}`\n\n")
+        parts.append("- `test_files/` - Generated test files\n")
+        parts.append("- `benchmarks/` - Performance benchmark results\n")
+        parts.append("- `stress_tests/` - Stress test results\n")
+        parts.append("- `validations/` - Optimization validation results\n")
+        parts.append("- `monitoring/` - Resource monitoring data\n")
         
         # Save report
         report_path = self.run_dir / "PERFORMANCE_TEST_REPORT.md"
         with open(report_path, 'w') as f:
-            f.write(report)
+            f.write("".join(parts))
         
         # Also save JSON results
         results_path = self.run_dir / "test_results.json"
@@ -362,7 +362,11 @@ class RecoveryValidator:
                 result.recommendations = self._generate_recommendations(scenario, result)
                 
         except Exception as e:
-            logger.error(f"Error during scenario: {e}", exc_info=True)
+            # Injected faults routinely land here; only walk the stack when debugging
+            logger.error(
+                f"Error during scenario: {type(e).__name__}: {e}",
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             result.error_messages.append(str(e))
             
         finally:
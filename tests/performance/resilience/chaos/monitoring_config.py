@@ -231,6 +231,8 @@ class HealthChecker:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.checks = []
+        # Created on the first Korean NLP check and reused by later runs
+        self._korean_processor = None
         
     def add_check(self, name: str, check_func, timeout: float = 5.0):
         """Add a health check"""
@@ -308,9 +310,10 @@ class HealthChecker:
     def check_korean_nlp(self) -> bool:
         """Check Korean NLP functionality"""
         try:
-            from packages.voidlight_markitdown.src.voidlight_markitdown._korean_utils import KoreanTextProcessor
-            processor = KoreanTextProcessor()
-            result = processor.detect_korean_ratio("안녕하세요")
+            if self._korean_processor is None:
+                from packages.voidlight_markitdown.src.voidlight_markitdown._korean_utils import KoreanTextProcessor
+                self._korean_processor = KoreanTextProcessor()
+            result = self._korean_processor.detect_korean_ratio("안녕하세요")
             return result > 0.5
         except:
             return False
@@ -5,6 +5,7 @@ Tests production error recovery mechanisms
 """
 
 import os
+import re
 import sys
 import json
 import time
@@ -23,6 +24,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from packages.voidlight_markitdown.src.voidlight_markitdown import VoidLightMarkItDown
 
+# Hangul syllable block, used to check that Korean text survived conversion
+HANGUL_SYLLABLE_RE = re.compile(r"[\uac00-\ud7a3]")
+
 
 class ChaosEngineeringTests:
     """Chaos engineering tests for production resilience"""
@@ -232,7 +236,7 @@ class ChaosEngineeringTests:
                 result = converter.convert(file_path)
                 if result and result.markdown:
                     # Check if Korean text is preserved or recovered
-                    if any(ord(c) >= 0xAC00 and ord(c) <= 0xD7A3 for c in result.markdown):
+                    if HANGUL_SYLLABLE_RE.search(result.markdown):
                         print(f"✅ Recovered Korean text from {description}")
                         passed += 1
                     else:
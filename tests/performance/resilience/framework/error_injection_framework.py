@@ -5,6 +5,7 @@ Systematic error injection for resilience testing
 """
 
 import os
+import re
 import sys
 import json
 import time
@@ -19,6 +20,9 @@ from typing import Dict, List, Any, Optional, Callable
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+# Any precomposed Hangul syllable counts as preserved Korean
+HANGUL_SYLLABLE_RE = re.compile(r"[\uac00-\ud7a3]")
+
 
 class ErrorInjector:
     """Framework for injecting various types of errors"""
@@ -429,8 +433,7 @@ class ResilienceValidator:
                     result = converter.convert(file_path)
                     
                     # Check if Korean preserved
-                    if result and any(ord(c) >= 0xAC00 and ord(c) <= 0xD7A3 
-                                    for c in (result.markdown or '')):
+                    if result and HANGUL_SYLLABLE_RE.search(result.markdown or ''):
                         successes += 1
                         print(f"  ✅ {description}: Korean preserved")
                     else:
@@ -5,6 +5,7 @@ Tests automatic recovery mechanisms and failover strategies
 """
 
 import os
+import re
 import sys
 import json
 import time
@@ -21,6 +22,9 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from packages.voidlight_markitdown.src.voidlight_markitdown import VoidLightMarkItDown
 
+# Precomposed Hangul syllables (U+AC00-U+D7A3)
+HANGUL_SYLLABLE_RE = re.compile(r"[\uac00-\ud7a3]")
+
 
 class RecoveryValidator:
     """Validates automatic recovery mechanisms"""
@@ -252,10 +256,7 @@ class RecoveryValidator:
             korean_preserved = False
             if result and result.markdown:
                 # Check for Korean characters
-                korean_preserved = any(
-                    ord(c) >= 0xAC00 and ord(c) <= 0xD7A3 
-                    for c in result.markdown
-                )
+                korean_preserved = bool(HANGUL_SYLLABLE_RE.search(result.markdown))
             
             # Check if any NLP features worked (even with fallback)
             nlp_worked = korean_preserved and len(result.markdown) > len(korean_text) * 0.8
@@ -0,0 +1,45 @@
+"""
+Unit tests for the PDF converter's stream handling.
+"""
+import gzip
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("pdfminer")
+
+from voidlight_markitdown import StreamInfo, VoidLightMarkItDown
+
+TEST_PDF = Path(__file__).parent.parent.parent / "fixtures" / "test.pdf"
+
+
+@pytest.fixture
+def converter() -> VoidLightMarkItDown:
+    return VoidLightMarkItDown()
+
+
+def _convert(converter: VoidLightMarkItDown, stream: io.IOBase) -> str:
+    return converter.convert_stream(stream, stream_info=StreamInfo(extension=".pdf")).markdown
+
+
+def test_pdf_converter_file_stream_matches_bytes(converter):
+    """A stream over a real file converts the same as the same bytes in memory."""
+    with open(TEST_PDF, "rb") as fh:
+        from_file = _convert(converter, fh)
+
+    assert from_file.strip()
+    assert from_file == _convert(converter, io.BytesIO(TEST_PDF.read_bytes()))
+
+
+def test_pdf_converter_gzip_stream_uses_decompressed_bytes(converter, temp_dir):
+    """Wrapped streams expose the compressed file's fileno(), which must not be mapped."""
+    gz_path = temp_dir / "test.pdf.gz"
+    with open(TEST_PDF, "rb") as src, gzip.open(gz_path, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+
+    with gzip.open(gz_path, "rb") as fh:
+        from_gzip = _convert(converter, fh)
+
+    assert from_gzip == _convert(converter, io.BytesIO(TEST_PDF.read_bytes()))